@@ -57,6 +57,7 @@ setup(
         ],
         "gpu": [
             "onnxruntime-gpu>=1.15.0",
+            "nvidia-ml-py>=11.450.51",
         ],
     },
     entry_points={
@@ -0,0 +1,85 @@
+"""
+Tests for checkpoint recovery in the request queue
+"""
+
+import asyncio
+import json
+
+from vietvoicetts.core import request_queue
+from vietvoicetts.core.request_queue import (
+    CheckpointPersistence, JobStatus, RequestQueueManager, TTSJob, TTSRequest
+)
+
+
+def _job(job_id: str, retry_count: int = 0) -> TTSJob:
+    return TTSJob(job_id=job_id, job_type="interactive_voice",
+                  request_data=TTSRequest(text="Xin chào"), retry_count=retry_count)
+
+
+def test_restore_requeues_unfinished_jobs(tmp_path):
+    async def run():
+        persistence = CheckpointPersistence(str(tmp_path))
+        queued, interrupted, exhausted = _job("queued"), _job("interrupted"), _job("exhausted", retry_count=2)
+        persistence.record_queued(queued)
+        persistence.record_started(interrupted)
+        persistence.record_started(exhausted)
+        await persistence.flush()
+
+        manager = RequestQueueManager(checkpoint_dir=str(tmp_path))
+        manager._restore_checkpoints()
+        await manager._persistence.flush()
+
+        assert set(manager.jobs) == {"queued", "interrupted"}
+        assert all(job.status == JobStatus.QUEUED for job in manager.jobs.values())
+        assert manager.jobs["queued"].retry_count == 0
+        # An interrupted job counts as a failed attempt
+        assert manager.jobs["interrupted"].retry_count == 1
+        assert manager.jobs["interrupted"].request_data.text == "Xin chào"
+        assert manager.pending_queue.qsize() == 2
+        assert manager.get_queue_status()["queue_status"]["queued_jobs"] == 2
+
+        # A job without retries left is dropped along with its checkpoint
+        assert not (tmp_path / "exhausted.json").exists()
+        assert json.loads((tmp_path / "interrupted.json").read_text())["retry_count"] == 1
+
+    asyncio.run(run())
+
+
+def test_stop_and_start_same_manager_resumes_jobs(tmp_path, monkeypatch):
+    monkeypatch.setattr(request_queue, "SHUTDOWN_GRACE_PERIOD", 0.05)
+
+    async def run():
+        manager = RequestQueueManager(max_concurrent_jobs=1, checkpoint_dir=str(tmp_path))
+        picked = []
+
+        async def hanging_process_job(job, worker_id):
+            manager._set_status(job, JobStatus.PROCESSING)
+            manager._persistence.record_started(job)
+            picked.append(job.job_id)
+            await asyncio.Event().wait()
+
+        manager._process_job = hanging_process_job
+        await manager.start()
+
+        running_id = await manager.submit_job("interactive_voice", {"text": "first"})
+        while not picked:
+            await asyncio.sleep(0.01)
+        queued_id = await manager.submit_job("interactive_voice", {"text": "second"})
+
+        await manager.stop()
+        assert manager.jobs == {}
+        assert (tmp_path / f"{running_id}.json").exists()
+        assert (tmp_path / f"{queued_id}.json").exists()
+
+        await manager.start()
+        assert set(manager.jobs) == {running_id, queued_id}
+        assert manager.jobs[running_id].retry_count == 1
+        assert manager.jobs[queued_id].retry_count == 0
+        while len(picked) < 2:
+            await asyncio.sleep(0.01)
+        # Restored in submission order
+        assert picked[1] == running_id
+
+        await manager.stop()
+
+    asyncio.run(run())
@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse, FileResponse, HTMLResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import logging
+import os
 import traceback
 from pathlib import Path
 
@@ -39,7 +40,8 @@ async def lifespan(app: FastAPI):
         # Initialize request queue manager
         from ..core.request_queue import initialize_queue_manager
         queue_manager = await initialize_queue_manager(
-            max_concurrent_jobs=10
+            max_concurrent_jobs=10,
+            checkpoint_dir=os.getenv("QUEUE_CHECKPOINT_DIR")
         )
         logger.info("Request Queue Manager initialized")
         
@@ -2,7 +2,7 @@
 FastAPI routers for TTS endpoints with multilingual and async support
 """
 
-from fastapi import APIRouter, HTTPException, File, UploadFile, Form, Depends
+from fastapi import APIRouter, HTTPException, File, UploadFile, Form, Depends, Response
 from typing import Optional
 import base64
 
@@ -323,8 +323,9 @@ async def get_job_status(
 ):
     """Get status of an async processing job"""
     try:
-        status_response = await service.get_job_status(job_id)
-        return status_response
+        # Served as pre-encoded JSON, finished jobs are serialized only once
+        content = await service.get_job_status_json(job_id)
+        return Response(content=content, media_type="application/json")
     except ValidationError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
@@ -705,7 +705,7 @@ class TTSService:
         
         try:
             # Get queue manager
-            queue_manager = get_queue_manager()
+            queue_manager = await get_queue_manager()
             
             # Create job
             job = await queue_manager.create_job(
@@ -738,33 +738,50 @@ class TTSService:
         from .schemas import JobStatusResponse
         
         try:
-            queue_manager = get_queue_manager()
-            job = await queue_manager.get_job(job_id)
+            queue_manager = await get_queue_manager()
+            status = await queue_manager.get_job_status(job_id)
             
-            if not job:
+            if not status:
                 raise ValidationError(f"Job {job_id} not found")
             
+            # JobProgress is slotted, read the progress from the job's status payload
+            progress = status["progress"]
+            result = status["result"]
             return JobStatusResponse(
-                job_id=job.job_id,
-                status=job.status.value,
-                progress=job.progress.__dict__ if job.progress else {},
-                result=job.result.__dict__ if job.result else None,
-                error=job.result.error_message if job.result and not job.result.success else None,
-                created_at=job.created_at,
-                started_at=job.started_at,
-                completed_at=job.completed_at,
-                estimated_remaining_time=job.estimated_remaining_time
+                job_id=status["job_id"],
+                status=status["status"],
+                progress=progress,
+                result=result,
+                error=result["error_message"] if result and not result["success"] else None,
+                created_at=status["created_at"],
+                started_at=status["started_at"],
+                completed_at=status["completed_at"],
+                estimated_remaining_time=progress["estimated_remaining_time"]
             )
             
         except Exception as e:
             raise TTSError(f"Failed to get job status: {str(e)}")
     
+    async def get_job_status_json(self, job_id: str) -> bytes:
+        """Get status of an async job as JSON bytes (encoded once for finished jobs)"""
+        from ..core.request_queue import get_queue_manager
+        
+        try:
+            queue_manager = await get_queue_manager()
+            content = await queue_manager.get_job_status_json(job_id)
+        except Exception as e:
+            raise TTSError(f"Failed to get job status: {str(e)}")
+        
+        if content is None:
+            raise ValidationError(f"Job {job_id} not found")
+        return content
+    
     async def cancel_job(self, job_id: str) -> Dict[str, Any]:
         """Cancel an async job"""
         from ..core.request_queue import get_queue_manager
         
         try:
-            queue_manager = get_queue_manager()
+            queue_manager = await get_queue_manager()
             result = await queue_manager.cancel_job(job_id)
             return {"cancelled": result, "job_id": job_id}
             
@@ -783,7 +800,10 @@ class TTSService:
                 # Use English TTS engine with cached model
                 from ..core.english_tts_engine import EnglishTTSEngine
                 engine = EnglishTTSEngine(config)
-                engine.model_session_manager = model_session_manager
+                # Swap in the cached manager and release the one the engine built
+                own_manager, engine.model_session_manager = engine.model_session_manager, model_session_manager
+                if own_manager is not model_session_manager:
+                    own_manager.cleanup()
                 
                 # English synthesis
                 audio_data, sample_rate = engine.synthesize(
@@ -798,7 +818,10 @@ class TTSService:
                 
                 # Create TTS engine with cached model session manager
                 engine = TTSEngine(config)
-                engine.model_session_manager = model_session_manager
+                # Swap in the cached manager and release the one the engine built
+                own_manager, engine.model_session_manager = engine.model_session_manager, model_session_manager
+                if own_manager is not model_session_manager:
+                    own_manager.cleanup()
                 
                 # Synthesize using TTS engine
                 audio_data, generation_time = engine.synthesize(
@@ -852,7 +875,11 @@ class TTSService:
             total_chunks = len(chunks)
             for i, chunk in enumerate(chunks):
                 if progress_callback:
-                    progress_callback(f"Processing chunk {i+1}/{total_chunks}", (i+1)/total_chunks * 100)
+                    progress_callback({
+                        "stage": "synthesis",
+                        "progress": (i+1)/total_chunks * 100,
+                        "message": f"Processing chunk {i+1}/{total_chunks}"
+                    })
                 
                 # Generate unique output path for this chunk
                 chunk_output = output_path.replace('.wav', f'_chunk_{i}.wav')
@@ -2,6 +2,10 @@
 Core TTS engine modules with multilingual support and GPU optimization
 """
 
+# Must run before anything imports torch
+from .cuda_allocator import configure_cuda_allocator
+configure_cuda_allocator()
+
 from .model_config import (
     ModelConfig, TTSConfig, 
     MODEL_GENDER, MODEL_GROUP, MODEL_AREA, MODEL_EMOTION,
@@ -19,7 +23,7 @@ from .model_cache import GlobalModelCache, get_global_cache, clear_global_cache,
 # New multilingual and performance components
 from .gpu_manager import GPUManager, get_gpu_manager, initialize_gpu_manager, shutdown_gpu_manager
 from .request_queue import (
-    RequestQueueManager, TTSJob, JobStatus, JobPriority,
+    RequestQueueManager, TTSJob, TTSRequest, JobStatus, JobPriority,
     get_queue_manager, initialize_queue_manager, shutdown_queue_manager
 )
 
@@ -59,6 +63,7 @@ __all__ = [
     # Request queue management
     "RequestQueueManager",
     "TTSJob",
+    "TTSRequest",
     "JobStatus",
     "JobPriority",
     "get_queue_manager",
@@ -0,0 +1,98 @@
+"""
+CUDA allocator bootstrap - stream-ordered (cudaMallocAsync) allocation with a
+raised memory pool release threshold.
+
+This module must be imported before ``torch`` so that PYTORCH_CUDA_ALLOC_CONF
+is in place when the CUDA caching allocator initializes.
+"""
+
+import os
+import ctypes
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Config flag: "1" enables the async allocator, anything else keeps PyTorch's native allocator
+CUDA_ASYNC_ALLOC_ENV = "VIETVOICETTS_CUDA_MALLOC_ASYNC"
+ASYNC_BACKEND = "backend:cudaMallocAsync"
+
+# cudaMemPoolAttr enum value (cuda_runtime_api.h)
+_CUDA_MEMPOOL_ATTR_RELEASE_THRESHOLD = 4
+_CUDART_CANDIDATES = ("libcudart.so", "libcudart.so.12", "libcudart.so.11.0", "cudart64_12.dll", "cudart64_110.dll")
+
+_cudart: Optional[ctypes.CDLL] = None
+
+
+def async_allocator_requested() -> bool:
+    """Whether the async allocator is enabled via config flag"""
+    return os.environ.get(CUDA_ASYNC_ALLOC_ENV, "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def configure_cuda_allocator() -> bool:
+    """
+    Select the cudaMallocAsync backend for PyTorch if enabled.
+
+    Must run before ``import torch``. An explicit PYTORCH_CUDA_ALLOC_CONF set by
+    the operator always wins.
+
+    Returns:
+        True if the async backend was configured
+    """
+    if not async_allocator_requested():
+        return False
+
+    existing = os.environ.get("PYTORCH_CUDA_ALLOC_CONF")
+    if existing:
+        return ASYNC_BACKEND in existing
+
+    os.environ["PYTORCH_CUDA_ALLOC_CONF"] = ASYNC_BACKEND
+    return True
+
+
+def _load_cudart() -> Optional[ctypes.CDLL]:
+    """Load libcudart through ctypes (cached)"""
+    global _cudart
+    if _cudart is not None:
+        return _cudart
+
+    for name in _CUDART_CANDIDATES:
+        try:
+            _cudart = ctypes.CDLL(name)
+            return _cudart
+        except OSError:
+            continue
+    return None
+
+
+def set_mempool_release_threshold(gpu_id: int, threshold: int = -1) -> bool:
+    """
+    Raise the release threshold of the default memory pool of a device so freed
+    blocks stay in-pool instead of being unmapped back to the driver.
+
+    Args:
+        gpu_id: CUDA device ordinal
+        threshold: Release threshold in bytes (-1 means UINT64_MAX, never release)
+
+    Returns:
+        True if the attribute was set
+    """
+    cudart = _load_cudart()
+    if cudart is None:
+        logger.warning("libcudart not found, cannot set memory pool release threshold")
+        return False
+
+    pool = ctypes.c_void_p()
+    err = cudart.cudaDeviceGetDefaultMemPool(ctypes.byref(pool), ctypes.c_int(gpu_id))
+    if err != 0:
+        logger.warning("cudaDeviceGetDefaultMemPool failed on GPU %d (error %d)", gpu_id, err)
+        return False
+
+    value = ctypes.c_uint64(threshold)
+    err = cudart.cudaMemPoolSetAttribute(pool, ctypes.c_int(_CUDA_MEMPOOL_ATTR_RELEASE_THRESHOLD),
+                                         ctypes.byref(value))
+    if err != 0:
+        logger.warning("cudaMemPoolSetAttribute failed on GPU %d (error %d)", gpu_id, err)
+        return False
+
+    return True
@@ -5,19 +5,32 @@ GPU Manager for dual RTX 5090 load balancing and optimization
 import os
 import time
 import threading
-import queue
-from typing import List, Optional, Dict, Any, Tuple
-from dataclasses import dataclass
+import heapq
+from contextlib import contextmanager
+from typing import List, Optional, Dict, Any, Tuple, Iterator
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+import numpy as np
+
+from .cuda_allocator import configure_cuda_allocator, async_allocator_requested, set_mempool_release_threshold
+
+# Allocator backend must be chosen before torch is imported
+configure_cuda_allocator()
+
 try:
     import torch
-    import psutil
     TORCH_AVAILABLE = True
 except ImportError:
     TORCH_AVAILABLE = False
 
+try:
+    import pynvml
+    NVML_AVAILABLE = True
+except ImportError:
+    NVML_AVAILABLE = False
+
 try:
     import onnxruntime as ort
     ONNX_AVAILABLE = True
@@ -35,18 +48,14 @@ class GPUStatus(Enum):
 
 @dataclass
 class GPUInfo:
-    """GPU information and status"""
+    """Static GPU properties and status (hot numeric stats live in GPUManager arrays)"""
     gpu_id: int
     name: str
     status: GPUStatus
     memory_total: int
-    memory_used: int
-    memory_free: int
-    utilization: float
     temperature: Optional[float] = None
     power_usage: Optional[float] = None
-    active_sessions: int = 0
-    last_updated: float = 0
+    last_updated: float = 0  # time.monotonic()
 
 
 @dataclass
@@ -55,8 +64,24 @@ class GPUAllocation:
     gpu_id: int
     session_id: str
     allocated_memory: int
-    start_time: float
+    start_time: float  # time.monotonic(), used for duration math
     estimated_duration: float
+    wall_start_time: float = field(default_factory=time.time)  # for human-readable logs
+    # Optional H2D overlap resources: two pinned host buffers + dedicated streams
+    host_buffers: Optional[List[Any]] = None
+    copy_stream: Any = None
+    compute_stream: Any = None
+
+
+logger = logging.getLogger(__name__)
+
+_BYTES_TO_GB = 1.0 / (1024**3)
+_CPU_PROVIDERS = ['CPUExecutionProvider']
+
+# Load score weights and EWMA smoothing factor
+SM_UTIL_WEIGHT = 0.6
+MEMORY_WEIGHT = 0.4
+UTIL_EWMA_ALPHA = 0.3
 
 
 class GPUManager:
@@ -71,17 +96,28 @@ class GPUManager:
     - Performance monitoring and statistics
     """
     
-    def __init__(self, max_concurrent_per_gpu: int = 5):
-        self.logger = logging.getLogger(__name__)
+    def __init__(self, max_concurrent_per_gpu: int = 5, max_session_duration: float = 600.0):
         self.max_concurrent_per_gpu = max_concurrent_per_gpu
+        self.max_session_duration = max_session_duration
         
         # GPU information and status
         self.gpus: Dict[int, GPUInfo] = {}
         self.allocations: Dict[str, GPUAllocation] = {}
+        # Min-heap of (start_time, session_id); stale entries are skipped lazily
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._nvml_handles: Dict[int, Any] = {}
+        
+        # Per-GPU hot stats as parallel arrays indexed by gpu_id
+        self._allocate_stat_arrays(0)
         
         # Thread safety
         self._lock = threading.RLock()
-        self._allocation_queue = queue.Queue()
+        # Wakes the monitor thread when allocations change
+        self._cond = threading.Condition(self._lock)
+        
+        # Cached get_gpu_status() snapshot, rebuilt only after state changes
+        self._status_dirty = True
+        self._status_cache: Optional[Dict[str, Any]] = None
         
         # Performance tracking
         self.performance_stats = {
@@ -95,6 +131,14 @@ class GPUManager:
         # Initialize GPU detection
         self._detect_gpus()
         
+        # Provider options are static per GPU, build them once
+        self._provider_cache: Dict[int, List[Any]] = self._build_provider_cache()
+        
+        # CPU-only deployments have nothing to monitor
+        if not self.gpus:
+            self._monitoring_active = False
+            return
+        
         # Start monitoring thread
         self._monitoring_active = True
         self._monitor_thread = threading.Thread(target=self._monitor_gpus, daemon=True)
@@ -102,26 +146,25 @@ class GPUManager:
     
     def _detect_gpus(self) -> None:
         """Detect available GPUs and their capabilities"""
-        self.logger.info("Detecting available GPUs...")
+        logger.info("Detecting available GPUs...")
         
         if not TORCH_AVAILABLE:
-            self.logger.warning("PyTorch not available for GPU detection")
+            logger.warning("PyTorch not available for GPU detection")
             return
         
         if not torch.cuda.is_available():
-            self.logger.warning("CUDA not available")
+            logger.warning("CUDA not available")
             return
         
         gpu_count = torch.cuda.device_count()
-        self.logger.info(f"Found {gpu_count} CUDA devices")
+        logger.info("Found %d CUDA devices", gpu_count)
+        self._allocate_stat_arrays(gpu_count)
         
         for gpu_id in range(gpu_count):
             try:
+                # Static properties are read once and cached in GPUInfo
                 device_props = torch.cuda.get_device_properties(gpu_id)
-                
-                # Get memory info
-                torch.cuda.set_device(gpu_id)
-                memory_total = torch.cuda.get_device_properties(gpu_id).total_memory
+                memory_total = device_props.total_memory
                 memory_reserved = torch.cuda.memory_reserved(gpu_id)
                 memory_free = memory_total - memory_reserved
                 
@@ -130,27 +173,86 @@ class GPUManager:
                     name=device_props.name,
                     status=GPUStatus.AVAILABLE,
                     memory_total=memory_total,
-                    memory_used=memory_reserved,
-                    memory_free=memory_free,
-                    utilization=0.0,
-                    last_updated=time.time()
+                    last_updated=time.monotonic()
                 )
                 
                 self.gpus[gpu_id] = gpu_info
-                self.logger.info(f"GPU {gpu_id}: {device_props.name} - "
-                               f"Memory: {memory_total // (1024**3):.1f}GB")
+                self._mem_total[gpu_id] = memory_total
+                self._mem_used[gpu_id] = memory_reserved
+                self._mem_free[gpu_id] = memory_free
+                self._available[gpu_id] = True
+                logger.info("GPU %d: %s - Memory: %.1fGB",
+                            gpu_id, device_props.name, memory_total // (1024**3))
                 
             except Exception as e:
-                self.logger.error(f"Error detecting GPU {gpu_id}: {e}")
+                logger.error("Error detecting GPU %d: %s", gpu_id, e)
+        
+        self._gpu_ids = np.fromiter(self.gpus.keys(), dtype=np.intp, count=len(self.gpus))
+        self._configure_memory_pools()
+        self._init_nvml()
+    
+    def _allocate_stat_arrays(self, gpu_count: int) -> None:
+        """Allocate the per-GPU stat arrays"""
+        self._util = np.zeros(gpu_count, dtype=np.float32)
+        self._score = np.zeros(gpu_count, dtype=np.float32)
+        self._mem_total = np.zeros(gpu_count, dtype=np.int64)
+        self._mem_used = np.zeros(gpu_count, dtype=np.int64)
+        self._mem_free = np.zeros(gpu_count, dtype=np.int64)
+        self._active = np.zeros(gpu_count, dtype=np.int32)
+        self._available = np.zeros(gpu_count, dtype=bool)
+        self._gpu_ids = np.zeros(0, dtype=np.intp)
+    
+    def _init_nvml(self) -> None:
+        """Open NVML handles for real SM utilization and memory readings"""
+        if not self.gpus or not NVML_AVAILABLE:
+            return
+        
+        try:
+            pynvml.nvmlInit()
+            for gpu_id in self.gpus:
+                # CUDA ordinals and NVML indices differ under CUDA_VISIBLE_DEVICES or the default
+                # FASTEST_FIRST order, so match the devices by PCI bus id
+                props = torch.cuda.get_device_properties(gpu_id)
+                pci_bus_id = f"{props.pci_domain_id:08X}:{props.pci_bus_id:02X}:{props.pci_device_id:02X}.0"
+                self._nvml_handles[gpu_id] = pynvml.nvmlDeviceGetHandleByPciBusId(pci_bus_id)
+        except Exception as e:
+            logger.warning("NVML unavailable, falling back to session-based utilization: %s", e)
+            self._nvml_handles.clear()
+    
+    def _configure_memory_pools(self) -> None:
+        """Keep freed blocks in the async allocator pool between sessions"""
+        if not self.gpus or not async_allocator_requested():
+            return
+        
+        backend = torch.cuda.get_allocator_backend()
+        if backend != "cudaMallocAsync":
+            logger.warning("cudaMallocAsync requested but allocator backend is '%s', "
+                           "using native allocator", backend)
+            return
+        
+        for gpu_id in self.gpus:
+            if set_mempool_release_threshold(gpu_id):
+                logger.info("GPU %d: async memory pool release threshold raised", gpu_id)
     
     def _monitor_gpus(self) -> None:
         """Background GPU monitoring thread"""
         while self._monitoring_active:
             try:
                 self._update_gpu_stats()
-                time.sleep(5)  # Update every 5 seconds
+                self.cleanup_expired_sessions(self.max_session_duration)
+                
+                # Update every 5 seconds, sooner if a session expires first or
+                # allocations change
+                with self._cond:
+                    if not self._monitoring_active:
+                        break
+                    timeout = 5.0
+                    if self._expiry_heap:
+                        next_expiry = self._expiry_heap[0][0] + self.max_session_duration
+                        timeout = min(timeout, max(0.0, next_expiry - time.monotonic()))
+                    self._cond.wait(timeout=timeout)
             except Exception as e:
-                self.logger.error(f"GPU monitoring error: {e}")
+                logger.error("GPU monitoring error: %s", e)
                 time.sleep(10)
     
     def _update_gpu_stats(self) -> None:
@@ -161,31 +263,49 @@ class GPUManager:
         with self._lock:
             for gpu_id, gpu_info in self.gpus.items():
                 try:
-                    torch.cuda.set_device(gpu_id)
+                    # Real device load from NVML when available, session count otherwise
+                    handle = self._nvml_handles.get(gpu_id)
+                    if handle is not None:
+                        sm_util = float(pynvml.nvmlDeviceGetUtilizationRates(handle).gpu)
+                        mem_info = pynvml.nvmlDeviceGetMemoryInfo(handle)
+                        memory_total = mem_info.total
+                        memory_free = mem_info.free
+                        memory_reserved = mem_info.used
+                    else:
+                        # Total memory is static (cached at detection); memory_reserved
+                        # takes an explicit device so no set_device switch is needed
+                        memory_total = gpu_info.memory_total
+                        memory_reserved = torch.cuda.memory_reserved(gpu_id)
+                        memory_free = memory_total - memory_reserved
+                        sm_util = min(100.0, 
+                            (self._active[gpu_id] / self.max_concurrent_per_gpu) * 100)
                     
-                    # Update memory usage
-                    memory_total = torch.cuda.get_device_properties(gpu_id).total_memory
-                    memory_reserved = torch.cuda.memory_reserved(gpu_id)
-                    memory_free = memory_total - memory_reserved
+                    self._mem_total[gpu_id] = memory_total
+                    self._mem_used[gpu_id] = memory_reserved
+                    self._mem_free[gpu_id] = memory_free
+                    gpu_info.last_updated = time.monotonic()
                     
-                    gpu_info.memory_total = memory_total
-                    gpu_info.memory_used = memory_reserved
-                    gpu_info.memory_free = memory_free
-                    gpu_info.last_updated = time.time()
+                    # Smooth utilization so selection doesn't oscillate between polls
+                    self._util[gpu_id] = ((1 - UTIL_EWMA_ALPHA) * self._util[gpu_id]
+                                          + UTIL_EWMA_ALPHA * sm_util)
                     
-                    # Calculate utilization based on active sessions
-                    gpu_info.utilization = min(100.0, 
-                        (gpu_info.active_sessions / self.max_concurrent_per_gpu) * 100)
+                    mem_used_frac = 1.0 - (memory_free / memory_total) if memory_total else 1.0
+                    self._score[gpu_id] = (SM_UTIL_WEIGHT * self._util[gpu_id] / 100.0
+                                           + MEMORY_WEIGHT * mem_used_frac)
                     
                     # Update status based on availability
-                    if gpu_info.active_sessions >= self.max_concurrent_per_gpu:
+                    if self._active[gpu_id] >= self.max_concurrent_per_gpu:
                         gpu_info.status = GPUStatus.BUSY
                     else:
                         gpu_info.status = GPUStatus.AVAILABLE
                         
                 except Exception as e:
-                    self.logger.error(f"Error updating GPU {gpu_id} stats: {e}")
+                    logger.error("Error updating GPU %d stats: %s", gpu_id, e)
                     gpu_info.status = GPUStatus.ERROR
+                
+                self._available[gpu_id] = gpu_info.status == GPUStatus.AVAILABLE
+            
+            self._status_dirty = True
     
     def get_optimal_gpu(self, estimated_memory: int = 0, 
                        estimated_duration: float = 30.0) -> Optional[int]:
@@ -200,27 +320,30 @@ class GPUManager:
             GPU ID or None if no GPU available
         """
         with self._lock:
-            available_gpus = [
-                (gpu_id, gpu_info) for gpu_id, gpu_info in self.gpus.items()
-                if gpu_info.status == GPUStatus.AVAILABLE and
-                   gpu_info.active_sessions < self.max_concurrent_per_gpu and
-                   gpu_info.memory_free >= estimated_memory
-            ]
+            candidates = np.flatnonzero(
+                self._available &
+                (self._active < self.max_concurrent_per_gpu) &
+                (self._mem_free >= estimated_memory)
+            )
             
-            if not available_gpus:
-                self.logger.warning("No available GPUs for allocation")
+            if candidates.size == 0:
+                logger.warning("No available GPUs for allocation")
                 return None
             
-            # Sort by utilization (lowest first) and memory availability
-            available_gpus.sort(key=lambda x: (x[1].utilization, -x[1].memory_free))
+            # Order by load score (lowest first), then pending sessions and memory availability
+            order = np.lexsort((-self._mem_free[candidates],
+                                self._active[candidates],
+                                self._score[candidates]))
             
-            selected_gpu_id = available_gpus[0][0]
-            self.logger.debug(f"Selected GPU {selected_gpu_id} for allocation")
+            selected_gpu_id = int(candidates[order[0]])
+            logger.debug("Selected GPU %d for allocation", selected_gpu_id)
             
             return selected_gpu_id
     
     def allocate_gpu(self, session_id: str, estimated_memory: int = 0,
-                    estimated_duration: float = 30.0) -> Optional[int]:
+                    estimated_duration: float = 30.0,
+                    staging_shape: Optional[Tuple[int, ...]] = None,
+                    staging_dtype: Any = None) -> Optional[int]:
         """
         Allocate a GPU for a specific session
         
@@ -228,6 +351,9 @@ class GPUManager:
             session_id: Unique session identifier
             estimated_memory: Estimated memory usage in bytes
             estimated_duration: Estimated task duration in seconds
+            staging_shape: If set, allocate two pinned host buffers of this shape
+                and dedicated copy/compute streams for overlapped H2D copies
+            staging_dtype: torch dtype of the staging buffers (default float32)
             
         Returns:
             Allocated GPU ID or None if allocation failed
@@ -235,26 +361,47 @@ class GPUManager:
         gpu_id = self.get_optimal_gpu(estimated_memory, estimated_duration)
         
         if gpu_id is None:
-            self.performance_stats["failed_allocations"] += 1
+            with self._lock:
+                self.performance_stats["failed_allocations"] += 1
+                self._status_dirty = True
             return None
         
+        # Pinned allocation is slow, keep it outside the lock
+        host_buffers, copy_stream, compute_stream = None, None, None
+        if staging_shape is not None and TORCH_AVAILABLE:
+            try:
+                dtype = staging_dtype or torch.float32
+                host_buffers = [torch.empty(staging_shape, dtype=dtype, pin_memory=True)
+                                for _ in range(2)]
+                copy_stream = torch.cuda.Stream(device=gpu_id)
+                compute_stream = torch.cuda.Stream(device=gpu_id)
+            except Exception as e:
+                logger.warning("Could not set up staging buffers for session %s: %s", session_id, e)
+                host_buffers, copy_stream, compute_stream = None, None, None
+        
         with self._lock:
             # Create allocation record
             allocation = GPUAllocation(
                 gpu_id=gpu_id,
                 session_id=session_id,
                 allocated_memory=estimated_memory,
-                start_time=time.time(),
-                estimated_duration=estimated_duration
+                start_time=time.monotonic(),
+                estimated_duration=estimated_duration,
+                host_buffers=host_buffers,
+                copy_stream=copy_stream,
+                compute_stream=compute_stream
             )
             
             self.allocations[session_id] = allocation
-            self.gpus[gpu_id].active_sessions += 1
+            self._active[gpu_id] += 1
+            heapq.heappush(self._expiry_heap, (allocation.start_time, session_id))
             
             self.performance_stats["successful_allocations"] += 1
             self.performance_stats["total_requests"] += 1
+            self._status_dirty = True
+            self._cond.notify()
             
-            self.logger.info(f"Allocated GPU {gpu_id} for session {session_id}")
+            logger.info("Allocated GPU %d for session %s", gpu_id, session_id)
             
             return gpu_id
     
@@ -270,7 +417,7 @@ class GPUManager:
         """
         with self._lock:
             if session_id not in self.allocations:
-                self.logger.warning(f"Session {session_id} not found for release")
+                logger.warning("Session %s not found for release", session_id)
                 return False
             
             allocation = self.allocations[session_id]
@@ -278,90 +425,127 @@ class GPUManager:
             
             # Update GPU status
             if gpu_id in self.gpus:
-                self.gpus[gpu_id].active_sessions = max(0, 
-                    self.gpus[gpu_id].active_sessions - 1)
+                self._active[gpu_id] = max(0, self._active[gpu_id] - 1)
             
             # Remove allocation
             del self.allocations[session_id]
+            self._status_dirty = True
+            self._cond.notify()
             
-            self.logger.info(f"Released GPU {gpu_id} for session {session_id}")
+            logger.info("Released GPU %d for session %s", gpu_id, session_id)
             
             return True
     
-    def get_onnx_providers(self, gpu_id: Optional[int] = None) -> List[str]:
+    @contextmanager
+    def with_stream(self, session_id: str) -> Iterator[Tuple[Any, Any]]:
         """
-        Get optimized ONNX providers for the specified or optimal GPU
+        Run a session's work on its dedicated streams
         
-        Args:
-            gpu_id: Specific GPU ID, or None for automatic selection
-            
-        Returns:
-            List of ONNX execution providers
+        Yields (copy_stream, compute_stream) with the compute stream current on the
+        session's device. Typical overlap pattern with the allocation's pinned buffers:
+        
+            host_buf.copy_(tensor)
+            with torch.cuda.stream(copy_stream):
+                gpu_buf.copy_(host_buf, non_blocking=True)
+            compute_stream.wait_stream(copy_stream)
+            # ... inference on gpu_buf ...
+        
+        Alternate between the two host buffers so the next copy overlaps compute.
         """
-        if not ONNX_AVAILABLE:
-            return ['CPUExecutionProvider']
+        with self._lock:
+            allocation = self.allocations.get(session_id)
         
-        providers = []
+        if allocation is None or allocation.copy_stream is None:
+            raise ValueError(f"Session {session_id} has no staging streams allocated")
         
-        # If specific GPU requested or GPUs available
-        if gpu_id is not None or self.gpus:
-            if gpu_id is None:
-                gpu_id = self.get_optimal_gpu()
-            
-            if gpu_id is not None:
-                providers.append(('CUDAExecutionProvider', {
+        with torch.cuda.device(allocation.gpu_id), torch.cuda.stream(allocation.compute_stream):
+            yield allocation.copy_stream, allocation.compute_stream
+    
+    def _build_provider_cache(self) -> Dict[int, List[Any]]:
+        """Build the ONNX provider list for every detected GPU"""
+        if not ONNX_AVAILABLE:
+            return {}
+        
+        return {
+            gpu_id: [
+                ('CUDAExecutionProvider', {
                     'device_id': gpu_id,
                     'arena_extend_strategy': 'kNextPowerOfTwo',
                     'gpu_mem_limit': 4 * 1024 * 1024 * 1024,  # 4GB limit
                     'cudnn_conv_algo_search': 'EXHAUSTIVE',
                     'do_copy_in_default_stream': True,
-                }))
-        
-        # Fallback providers
-        providers.extend([
-            'CPUExecutionProvider'
-        ])
+                }),
+                'CPUExecutionProvider'
+            ]
+            for gpu_id in self.gpus
+        }
+    
+    def get_onnx_providers(self, gpu_id: Optional[int] = None) -> List[Any]:
+        """
+        Get optimized ONNX providers for an allocated GPU
         
-        return providers
+        Args:
+            gpu_id: GPU ID returned by allocate_gpu, or None for CPU only
+            
+        Returns:
+            List of ONNX execution providers (shared, do not mutate)
+        """
+        return self._provider_cache.get(gpu_id, _CPU_PROVIDERS)
     
     def get_gpu_status(self) -> Dict[str, Any]:
-        """Get comprehensive GPU status information"""
+        """
+        Get comprehensive GPU status information (cached until state changes)
+        
+        Returns:
+            GPU status snapshot (shared between callers, do not mutate)
+        """
+        if not self._status_dirty and self._status_cache is not None:
+            return self._status_cache
+        
         with self._lock:
-            status = {
-                "total_gpus": len(self.gpus),
-                "available_gpus": len([g for g in self.gpus.values() 
-                                     if g.status == GPUStatus.AVAILABLE]),
-                "busy_gpus": len([g for g in self.gpus.values() 
-                                if g.status == GPUStatus.BUSY]),
-                "active_sessions": len(self.allocations),
-                "performance_stats": self.performance_stats.copy(),
-                "gpu_details": {}
-            }
+            # Calculate average utilization
+            if self.gpus:
+                util = self._util[self._gpu_ids]
+                self.performance_stats["average_gpu_utilization"] = float(util.mean())
+                
+                # Calculate load balance efficiency
+                max_util = float(util.max())
+                balance_eff = 100.0 - (max_util - float(util.min())) if max_util > 0 else 100.0
+                self.performance_stats["load_balance_efficiency"] = balance_eff
             
+            available_count = 0
+            busy_count = 0
+            gpu_details = {}
             for gpu_id, gpu_info in self.gpus.items():
-                status["gpu_details"][str(gpu_id)] = {
+                if gpu_info.status == GPUStatus.AVAILABLE:
+                    available_count += 1
+                elif gpu_info.status == GPUStatus.BUSY:
+                    busy_count += 1
+                
+                gpu_details[str(gpu_id)] = {
                     "name": gpu_info.name,
                     "status": gpu_info.status.value,
-                    "memory_total_gb": gpu_info.memory_total / (1024**3),
-                    "memory_used_gb": gpu_info.memory_used / (1024**3),
-                    "memory_free_gb": gpu_info.memory_free / (1024**3),
-                    "utilization_percent": gpu_info.utilization,
-                    "active_sessions": gpu_info.active_sessions,
+                    "memory_total_gb": float(self._mem_total[gpu_id]) * _BYTES_TO_GB,
+                    "memory_used_gb": float(self._mem_used[gpu_id]) * _BYTES_TO_GB,
+                    "memory_free_gb": float(self._mem_free[gpu_id]) * _BYTES_TO_GB,
+                    "utilization_percent": float(self._util[gpu_id]),
+                    "active_sessions": int(self._active[gpu_id]),
                     "last_updated": gpu_info.last_updated
                 }
             
-            # Calculate average utilization
-            if self.gpus:
-                avg_util = sum(g.utilization for g in self.gpus.values()) / len(self.gpus)
-                self.performance_stats["average_gpu_utilization"] = avg_util
-                
-                # Calculate load balance efficiency
-                max_util = max(g.utilization for g in self.gpus.values()) if self.gpus else 0
-                min_util = min(g.utilization for g in self.gpus.values()) if self.gpus else 0
-                balance_eff = 100.0 - (max_util - min_util) if max_util > 0 else 100.0
-                self.performance_stats["load_balance_efficiency"] = balance_eff
+            self._status_cache = {
+                "total_gpus": len(self.gpus),
+                "available_gpus": available_count,
+                "busy_gpus": busy_count,
+                "active_sessions": len(self.allocations),
+                "performance_stats": self.performance_stats.copy(),
+                "gpu_details": gpu_details
+            }
+            # Cleared only once the new snapshot is in place, so lock-free readers never
+            # take the previous snapshot for a fresh one
+            self._status_dirty = False
             
-            return status
+            return self._status_cache
     
     def cleanup_expired_sessions(self, max_duration: float = 600.0) -> int:
         """
@@ -373,28 +557,38 @@ class GPUManager:
         Returns:
             Number of sessions cleaned up
         """
-        current_time = time.time()
+        if not self.gpus:
+            return 0
+        
+        expire_before = time.monotonic() - max_duration
         expired_sessions = []
         
         with self._lock:
-            for session_id, allocation in self.allocations.items():
-                if current_time - allocation.start_time > max_duration:
-                    expired_sessions.append(session_id)
+            heap = self._expiry_heap
+            while heap and heap[0][0] < expire_before:
+                start_time, session_id = heapq.heappop(heap)
+                allocation = self.allocations.get(session_id)
+                # Skip entries for sessions already released or re-allocated
+                if allocation is not None and allocation.start_time == start_time:
+                    expired_sessions.append((session_id, allocation.wall_start_time))
         
         # Release expired sessions
         cleaned_count = 0
-        for session_id in expired_sessions:
+        for session_id, wall_start_time in expired_sessions:
             if self.release_gpu(session_id):
                 cleaned_count += 1
-                self.logger.warning(f"Cleaned up expired session {session_id}")
+                logger.warning("Cleaned up expired session %s (started %s)", session_id,
+                               time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(wall_start_time)))
         
         return cleaned_count
     
     def shutdown(self) -> None:
         """Shutdown the GPU manager and clean up resources"""
-        self.logger.info("Shutting down GPU manager...")
+        logger.info("Shutting down GPU manager...")
         
-        self._monitoring_active = False
+        with self._cond:
+            self._monitoring_active = False
+            self._cond.notify_all()
         
         # Wait for monitor thread to finish
         if hasattr(self, '_monitor_thread'):
@@ -406,34 +600,46 @@ class GPUManager:
             for session_id in session_ids:
                 self.release_gpu(session_id)
         
-        self.logger.info("GPU manager shutdown complete")
+        if self._nvml_handles:
+            try:
+                pynvml.nvmlShutdown()
+            except Exception:
+                pass
+            self._nvml_handles.clear()
+        
+        logger.info("GPU manager shutdown complete")
 
 
 # Global GPU manager instance
 _gpu_manager: Optional[GPUManager] = None
+_gpu_manager_lock = threading.Lock()
 
 
 def get_gpu_manager() -> GPUManager:
     """Get the global GPU manager instance"""
     global _gpu_manager
     if _gpu_manager is None:
-        _gpu_manager = GPUManager()
+        with _gpu_manager_lock:
+            if _gpu_manager is None:
+                _gpu_manager = GPUManager()
     return _gpu_manager
 
 
 def initialize_gpu_manager(max_concurrent_per_gpu: int = 5) -> GPUManager:
     """Initialize the global GPU manager with custom settings"""
     global _gpu_manager
-    if _gpu_manager is not None:
-        _gpu_manager.shutdown()
-    
-    _gpu_manager = GPUManager(max_concurrent_per_gpu=max_concurrent_per_gpu)
-    return _gpu_manager
+    with _gpu_manager_lock:
+        if _gpu_manager is not None:
+            _gpu_manager.shutdown()
+        
+        _gpu_manager = GPUManager(max_concurrent_per_gpu=max_concurrent_per_gpu)
+        return _gpu_manager
 
 
 def shutdown_gpu_manager() -> None:
     """Shutdown the global GPU manager"""
     global _gpu_manager
-    if _gpu_manager is not None:
-        _gpu_manager.shutdown()
-        _gpu_manager = None
+    with _gpu_manager_lock:
+        if _gpu_manager is not None:
+            _gpu_manager.shutdown()
+            _gpu_manager = None
@@ -3,32 +3,102 @@ Model session management for ONNX Runtime
 """
 
 import os
+import hashlib
+import mmap
 import tarfile
 import tempfile
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
+import wave
+import weakref
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, Union
 import json
+from itertools import product
+import numpy as np
 import onnxruntime
 import random
 
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
 from .model_config import ModelConfig, MODEL_GENDER, MODEL_GROUP, MODEL_AREA, MODEL_EMOTION
+from .quantization import QUANTIZED_MODELS, quantized_name
+
+# Model archive layout
+AUDIO_DIR = "cleaned_audios/"
+METADATA_FILE = "audio_metadata.json"
+TAR_READ_BUFFER = 1 << 20
+
+# Sample metadata attributes, in sample index key order
+SAMPLE_KEYS = ("gender", "group", "area", "emotion")
+SAMPLE_CHOICE_CACHE_SIZE = 256
+
+# Warmup inputs: reference clip length and token count for the synthetic first run
+WARMUP_REFERENCE_SECONDS = 5.0
+WARMUP_TEXT_LENGTH = 256
+
+# Serialized optimized graphs, stored next to the cached model archive
+OPTIMIZED_MODEL_DIR = "ort_optimized"
 
 
 class ModelSessionManager:
     """Manages ONNX Runtime sessions"""
     
+    # English placeholder reference audio, shared by all instances
+    _silence_wav_path: Optional[str] = None
+    _silence_lock = threading.Lock()
+    
     def __init__(self, config: ModelConfig):
         self.config = config
+        self.device_id = self.config.gpu_id or 0
         self.providers = self._get_optimal_providers()
+        self.use_cuda = any(self._provider_name(p) == 'CUDAExecutionProvider' for p in self.providers)
         self.sessions = {}
         self.input_names = {}
         self.output_names = {}
         self.sample_metadata = {}
+        self._sample_index = {}  # (gender, group, area, emotion) with None wildcards -> sample indices
+        # Bounded cache of sample choices, keeps the voice consistent across chunks. A plain
+        # dict: an lru_cache around a bound method would tie the manager into a reference cycle
+        self._sample_choices: Dict[Tuple, int] = {}
+        self._audio_paths = {}  # file_name -> reference audio extracted under temp_dir
         self.temp_dir = None
+        # Safety net: removes temp_dir if the manager is dropped without cleanup()
+        self._temp_dir_finalizer = None
         self.vocab_path = None
         
-    def _get_optimal_providers(self) -> List[str]:
+        # IOBinding state for the CUDA provider path (bindings are per thread)
+        self.use_io_binding = self.use_cuda
+        self._binding_local = threading.local()
+        
+    @staticmethod
+    def _provider_name(provider: Any) -> str:
+        """Provider name of a bare or (name, options) provider entry"""
+        return provider[0] if isinstance(provider, tuple) else provider
+    
+    def _get_cuda_provider_options(self) -> Dict[str, Any]:
+        """CUDA execution provider options
+        
+        Heuristic cuDNN conv algorithm search avoids the multi-second exhaustive
+        benchmarking ORT does by default on the first Run() of each input shape.
+        """
+        options = {
+            'device_id': self.device_id,
+            'cudnn_conv_algo_search': 'HEURISTIC',
+            'do_copy_in_default_stream': True,
+            'arena_extend_strategy': 'kSameAsRequested',
+        }
+        if self.config.gpu_mem_limit > 0:
+            options['gpu_mem_limit'] = self.config.gpu_mem_limit
+        return options
+    
+    def _get_optimal_providers(self) -> List[Any]:
         """Get the fastest available providers"""
         available_providers = onnxruntime.get_available_providers()
         
@@ -40,34 +110,111 @@ class ModelSessionManager:
         selected_providers = []
         for provider in provider_priority:
             if provider in available_providers:
-                selected_providers.append(provider)
+                if provider == 'CUDAExecutionProvider':
+                    selected_providers.append((provider, self._get_cuda_provider_options()))
+                else:
+                    selected_providers.append(provider)
         
         if 'CPUExecutionProvider' not in selected_providers:
             selected_providers.append('CPUExecutionProvider')
         
         return selected_providers
     
-    def _create_session_options(self) -> onnxruntime.SessionOptions:
-        """Create optimized ONNX Runtime session options"""
+    def _physical_cores(self) -> int:
+        """Number of physical CPU cores (logical count if unknown)"""
+        cores = psutil.cpu_count(logical=False) if PSUTIL_AVAILABLE else None
+        return cores or os.cpu_count() or 1
+    
+    def _intra_op_threads(self) -> int:
+        """Intra-op thread count, split across the sessions expected to run concurrently"""
+        if self.config.intra_op_num_threads > 0:
+            return self.config.intra_op_num_threads
+        concurrent_sessions = max(1, self.config.max_concurrent_requests)
+        return max(1, self._physical_cores() // concurrent_sessions)
+    
+    def _create_session_options(self, load_optimized: bool = False) -> onnxruntime.SessionOptions:
+        """Create optimized ONNX Runtime session options
+        
+        Args:
+            load_optimized: The model is a pre-optimized ORT format graph, skip graph optimization
+        """
         session_opts = onnxruntime.SessionOptions()
         session_opts.log_severity_level = self.config.log_severity_level
         session_opts.log_verbosity_level = self.config.log_verbosity_level
         session_opts.inter_op_num_threads = self.config.inter_op_num_threads
-        session_opts.intra_op_num_threads = self.config.intra_op_num_threads
+        session_opts.intra_op_num_threads = self._intra_op_threads()
+        # Input lengths vary per request and memory patterns are off, so an arena grows to the
+        # peak of every shape it sees. Disabling it keeps RSS near the model size at the cost
+        # of per-run allocations.
         session_opts.enable_cpu_mem_arena = self.config.enable_cpu_mem_arena
         session_opts.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
-        session_opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
-        session_opts.add_session_config_entry("session.intra_op.allow_spinning", "1")
-        session_opts.add_session_config_entry("session.inter_op.allow_spinning", "1")
+        if load_optimized:
+            session_opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_DISABLE_ALL
+            session_opts.add_session_config_entry("session.load_model_format", "ORT")
+        else:
+            session_opts.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # Spin only when a single session owns the cores, park threads under contention.
+        # Inter-op spinning is pointless with sequential execution and left at its default.
+        spinning = "1" if self.config.max_concurrent_requests <= 1 else "0"
+        session_opts.add_session_config_entry("session.intra_op.allow_spinning", spinning)
         session_opts.add_session_config_entry("session.set_denormal_as_zero", "1")
         
-        # Memory optimization settings to prevent allocation errors
-        session_opts.add_session_config_entry("session.memory.enable_memory_pattern", "0")
-        session_opts.add_session_config_entry("session.memory.enable_memory_arena_shrinkage", "1")
+        # Memory patterns are planned per input shape and never reused across variable lengths
+        session_opts.enable_mem_pattern = False
         session_opts.add_session_config_entry("session.use_env_allocators", "1")
         
         return session_opts
     
+    def _optimized_model_path(self, model_name: str, model_path: str) -> Path:
+        """Location of the serialized optimized graph for a model and the active provider"""
+        device = 'cuda' if self.use_cuda else 'cpu'
+        return Path(model_path).parent / OPTIMIZED_MODEL_DIR / f"{model_name}.{device}.ort"
+    
+    def _create_session(self, model_name: str, model_file: Optional[Path], model_path: str,
+                        prebaked_file: Optional[Path] = None) -> onnxruntime.InferenceSession:
+        """Create an inference session, reusing a serialized optimized graph when available
+        
+        Graph optimization runs once: the first load saves the optimized graph next to the
+        cached model archive and later cold starts load it directly. Models are loaded from
+        their extracted files so no Python-side copy of the model bytes is kept.
+        """
+        # Pre-optimized graph shipped inside the archive
+        if prebaked_file is not None:
+            return onnxruntime.InferenceSession(
+                str(prebaked_file),
+                sess_options=self._create_session_options(load_optimized=True),
+                providers=self.providers
+            )
+        
+        ort_path = self._optimized_model_path(model_name, model_path)
+        if ort_path.exists() and ort_path.stat().st_mtime >= Path(model_path).stat().st_mtime:
+            try:
+                return onnxruntime.InferenceSession(
+                    str(ort_path),
+                    sess_options=self._create_session_options(load_optimized=True),
+                    providers=self.providers
+                )
+            except Exception as e:
+                print(f"Discarding unusable optimized model {ort_path}: {e}")
+                ort_path.unlink(missing_ok=True)
+        
+        if model_file is None:
+            raise FileNotFoundError(f"Model file '{model_name}.onnx' not found in model archive")
+        
+        session_opts = self._create_session_options()
+        try:
+            ort_path.parent.mkdir(parents=True, exist_ok=True)
+            session_opts.optimized_model_filepath = str(ort_path)
+            session_opts.add_session_config_entry("session.save_model_format", "ORT")
+        except OSError as e:
+            print(f"Cannot cache optimized model for {model_name}: {e}")
+        
+        return onnxruntime.InferenceSession(
+            str(model_file),
+            sess_options=session_opts,
+            providers=self.providers
+        )
+    
     def _load_models_from_file(self) -> None:
         """Load ONNX models from downloaded model file and extract vocab"""
         # Ensure model is downloaded and get path
@@ -83,62 +230,229 @@ class ModelSessionManager:
         }
         
         try:
-            with tarfile.open(model_path, 'r') as tar:
-                tar_members = tar.getnames()
-                
-                # Load metadata.json
-                self.sample_metadata = json.load(tar.extractfile("audio_metadata.json"))
-                
-                # Load ONNX models
-                for model_name, filename in expected_models.items():
-                    matching_member = next((m for m in tar_members if m.endswith(filename)), None)
-                    if not matching_member:
-                        raise FileNotFoundError(f"Model file '{filename}' not found in model archive")
-                    
-                    extracted_file = tar.extractfile(matching_member)
-                    if not extracted_file:
-                        raise RuntimeError(f"Failed to extract {filename} from model archive")
-                    
-                    model_bytes = extracted_file.read()
-                    session_opts = self._create_session_options()
-                    session = onnxruntime.InferenceSession(
-                        model_bytes,
-                        sess_options=session_opts,
-                        providers=self.providers
-                    )
-                    
-                    self.sessions[model_name] = session
-                    self.input_names[model_name] = [inp.name for inp in session.get_inputs()]
-                    self.output_names[model_name] = [out.name for out in session.get_outputs()]
-                
-                # Extract vocab.txt to temporary file
-                vocab_member = next((m for m in tar_members if m.endswith('vocab.txt')), None)
-                if not vocab_member:
-                    raise FileNotFoundError("Vocabulary file 'vocab.txt' not found in model archive")
-                
-                self.temp_dir = tempfile.mkdtemp(prefix="tts_vocab_")
-                vocab_temp_path = Path(self.temp_dir) / 'vocab.txt'
-                
-                extracted_file = tar.extractfile(vocab_member)
-                if not extracted_file:
-                    raise RuntimeError("Failed to extract vocab.txt from model archive")
-                
-                with open(vocab_temp_path, 'wb') as f:
-                    f.write(extracted_file.read())
-                
-                self.vocab_path = str(vocab_temp_path)
-                
+            # Single streaming pass over the archive with a large read buffer
+            prebaked_models = {name: f"{name}.ort" for name in expected_models}
+            int8_models = {name: quantized_name(name) for name in QUANTIZED_MODELS}
+            wanted = (tuple(expected_models.values()) + tuple(prebaked_models.values())
+                      + tuple(int8_models.values()) + ('vocab.txt',))
+            archive_files = {}  # wanted file name -> extracted path under temp_dir
+            metadata_bytes = None
+            self._audio_paths = {}
+            self._remove_temp_dir()
+            self.temp_dir = tempfile.mkdtemp(prefix="tts_vocab_")
+            self._temp_dir_finalizer = weakref.finalize(self, shutil.rmtree, self.temp_dir, True)
+            audio_dir = Path(self.temp_dir) / 'audio'
+            
+            with open(model_path, 'rb', buffering=TAR_READ_BUFFER) as raw, \
+                    tarfile.open(fileobj=raw, mode='r|', bufsize=TAR_READ_BUFFER) as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    name = member.name
+                    if name.startswith(AUDIO_DIR):
+                        file_name = name[len(AUDIO_DIR):]
+                        audio_path = audio_dir / file_name
+                        if '..' in Path(file_name).parts or audio_dir not in audio_path.parents:
+                            continue
+                        audio_path.parent.mkdir(parents=True, exist_ok=True)
+                        with open(audio_path, 'wb') as f:
+                            shutil.copyfileobj(tar.extractfile(member), f, TAR_READ_BUFFER)
+                        self._audio_paths[file_name] = audio_path
+                    elif name == METADATA_FILE:
+                        metadata_bytes = tar.extractfile(member).read()
+                    elif name.endswith(wanted):
+                        filename = next(w for w in wanted if name.endswith(w))
+                        # Keep the first match, as a by-name lookup would
+                        if filename not in archive_files:
+                            extracted_path = Path(self.temp_dir) / filename
+                            with open(extracted_path, 'wb') as f:
+                                shutil.copyfileobj(tar.extractfile(member), f, TAR_READ_BUFFER)
+                            archive_files[filename] = extracted_path
+            
+            # Load metadata.json
+            if metadata_bytes is None:
+                raise FileNotFoundError(f"Metadata file '{METADATA_FILE}' not found in model archive")
+            self.sample_metadata = json.loads(metadata_bytes)
+            self._build_sample_index()
+            
+            # Load ONNX models, graph optimization runs in native code so the sessions build in parallel
+            model_args = []
+            for model_name, filename in expected_models.items():
+                model_file = archive_files.pop(filename, None)
+                prebaked_file = archive_files.pop(prebaked_models[model_name], None)
+                int8_file = archive_files.pop(int8_models.get(model_name), None)
+                # INT8 graphs are only faster on the CPU path
+                if int8_file is not None and self.config.use_int8_on_cpu and not self.use_cuda:
+                    model_args.append((f"{model_name}.int8", int8_file, model_path, None))
+                else:
+                    model_args.append((model_name, model_file, model_path, prebaked_file))
+            with ThreadPoolExecutor(max_workers=len(model_args), thread_name_prefix="ort-load") as executor:
+                sessions = list(executor.map(lambda args: self._create_session(*args), model_args))
+            
+            for model_name, session in zip(expected_models, sessions):
+                self.sessions[model_name] = session
+                self.input_names[model_name] = [inp.name for inp in session.get_inputs()]
+                self.output_names[model_name] = [out.name for out in session.get_outputs()]
+            
+            # vocab.txt was extracted to the temporary directory
+            vocab_temp_path = archive_files.pop('vocab.txt', None)
+            if vocab_temp_path is None:
+                raise FileNotFoundError("Vocabulary file 'vocab.txt' not found in model archive")
+            
+            self.vocab_path = str(vocab_temp_path)
+            
         except Exception as e:
-            if self.temp_dir and Path(self.temp_dir).exists():
-                shutil.rmtree(self.temp_dir)
-                self.temp_dir = None
+            self._remove_temp_dir()
             raise RuntimeError(f"Failed to load models from file: {str(e)}")
     
-    def load_models(self) -> None:
-        """Load all ONNX models from downloaded model file"""
+    def get_io_binding(self, model_name: str) -> onnxruntime.IOBinding:
+        """Get the calling thread's IOBinding for a model session"""
+        bindings = getattr(self._binding_local, 'bindings', None)
+        if bindings is None:
+            bindings = self._binding_local.bindings = {}
+            self._binding_local.staging = {}
+        
+        binding = bindings.get(model_name)
+        if binding is None:
+            binding = bindings[model_name] = self.sessions[model_name].io_binding()
+        return binding
+    
+    def to_device(self, array: np.ndarray) -> onnxruntime.OrtValue:
+        """Copy a host array into a CUDA-resident OrtValue"""
+        return onnxruntime.OrtValue.ortvalue_from_numpy(np.ascontiguousarray(array), 'cuda', self.device_id)
+    
+    def _pinned_staging(self, model_name: str, input_name: str,
+                        array: np.ndarray) -> Optional[onnxruntime.OrtValue]:
+        """Copy a host input into a reusable pinned staging buffer"""
+        staging = self._binding_local.staging
+        key = (model_name, input_name, array.shape, array.dtype)
+        value = staging.get(key)
+        if value is None:
+            try:
+                value = onnxruntime.OrtValue.ortvalue_from_shape_and_type(
+                    array.shape, array.dtype.type, 'cuda_pinned', self.device_id)
+            except Exception:
+                return None
+            # Shapes vary per chunk, keep only the current buffer per input
+            for stale in [k for k in staging if k[:2] == key[:2]]:
+                del staging[stale]
+            staging[key] = value
+        value.update_inplace(np.ascontiguousarray(array))
+        return value
+    
+    def run_with_binding(self, model_name: str, inputs: Dict[str, Any],
+                         keep_on_device: bool = False) -> List[Any]:
+        """
+        Run a model through IOBinding so inputs and outputs stay device-resident
+        
+        Args:
+            model_name: Session name (preprocess, transformer, decode)
+            inputs: Input name -> numpy array (staged through pinned memory) or CUDA OrtValue
+            keep_on_device: Return CUDA OrtValues instead of copying outputs to host
+            
+        Returns:
+            Outputs in session output order
+        """
+        session = self.sessions[model_name]
+        binding = self.get_io_binding(model_name)
+        binding.clear_binding_inputs()
+        binding.clear_binding_outputs()
+        
+        for name, value in inputs.items():
+            if isinstance(value, onnxruntime.OrtValue):
+                binding.bind_ortvalue_input(name, value)
+                continue
+            staged = self._pinned_staging(model_name, name, value)
+            if staged is not None:
+                binding.bind_ortvalue_input(name, staged)
+            else:
+                binding.bind_cpu_input(name, np.ascontiguousarray(value))
+        
+        for name in self.output_names[model_name]:
+            binding.bind_output(name, 'cuda', self.device_id)
+        
+        session.run_with_iobinding(binding)
+        
+        if keep_on_device:
+            return binding.get_outputs()
+        return binding.copy_outputs_to_cpu()
+    
+    def _build_sample_index(self) -> None:
+        """Index samples under every wildcard combination of their attributes"""
+        index = {}
+        for idx, sample in enumerate(self.sample_metadata):
+            values = tuple(sample.get(key) for key in SAMPLE_KEYS)
+            for key in product(*((value, None) for value in values)):
+                index.setdefault(key, []).append(idx)
+        self._sample_index = index
+    
+    def _run(self, model_name: str, inputs: Dict[str, np.ndarray]) -> List[np.ndarray]:
+        """Run a session through the same path inference uses"""
+        if self.use_io_binding:
+            return self.run_with_binding(model_name, inputs)
+        return self.sessions[model_name].run(self.output_names[model_name], inputs)
+    
+    def warmup(self) -> None:
+        """
+        Run the full preprocess -> transformer -> decode chain once at the maximum chunk length
+        
+        Memory arenas and cuDNN algorithm caches fill lazily on the first Run() of a
+        shape; doing it here keeps that spike out of the first request.
+        """
+        start = time.perf_counter()
+        hop_length = self.config.hop_length
+        ref_samples = int(WARMUP_REFERENCE_SECONDS * self.config.sample_rate)
+        max_audio_len = int(self.config.max_chunk_duration * self.config.sample_rate) // hop_length + 1
+        
+        audio = np.zeros((1, 1, ref_samples), dtype=np.int16)
+        text_ids = np.zeros((1, WARMUP_TEXT_LENGTH), dtype=np.int32)
+        max_duration = np.array([max_audio_len], dtype=np.int64)
+        
+        names = self.input_names['preprocess']
+        (noise, rope_cos_q, rope_sin_q, rope_cos_k, rope_sin_k,
+         cat_mel_text, cat_mel_text_drop, ref_signal_len) = self._run('preprocess', {
+            names[0]: audio,
+            names[1]: text_ids,
+            names[2]: max_duration
+        })
+        
+        names = self.input_names['transformer']
+        noise, _ = self._run('transformer', {
+            names[0]: noise,
+            names[1]: rope_cos_q,
+            names[2]: rope_sin_q,
+            names[3]: rope_cos_k,
+            names[4]: rope_sin_k,
+            names[5]: cat_mel_text,
+            names[6]: cat_mel_text_drop,
+            names[7]: np.array([0], dtype=np.int32)
+        })
+        
+        names = self.input_names['decode']
+        self._run('decode', {
+            names[0]: noise,
+            names[1]: ref_signal_len
+        })
+        
+        print(f"Warmed up model sessions in {time.perf_counter() - start:.2f}s")
+    
+    def load_models(self, warmup: Optional[bool] = None) -> None:
+        """Load all ONNX models from downloaded model file
+        
+        Args:
+            warmup: Run warmup() after loading (defaults to config.warmup_sessions). Only worth
+                it for long-lived managers, a per-request manager would pay for it every time.
+        """
         onnxruntime.set_seed(self.config.random_seed)
         random.seed(self.config.random_seed)
         self._load_models_from_file()
+        
+        if self.config.warmup_sessions if warmup is None else warmup:
+            try:
+                self.warmup()
+            except Exception as e:
+                # A failed warmup only costs first-request latency
+                print(f"Warning: model session warmup failed: {e}")
     
     def select_sample(self, gender: Optional[str] = None,
                      group: Optional[str] = None,
@@ -146,8 +460,12 @@ class ModelSessionManager:
                      emotion: Optional[str] = None,
                      reference_audio: Optional[str] = None,
                      reference_text: Optional[str] = None,
-                     voice_id: Optional[str] = None) -> Tuple[str, str]:
-        """Select a sample from the metadata"""
+                     voice_id: Optional[str] = None) -> Tuple[Union[str, memoryview], str]:
+        """Select a sample from the metadata
+        
+        Returns:
+            Reference audio (file path, or a read-only view of a built-in sample) and its text
+        """
         
         # Handle English model differently
         if self.config.language == "english":
@@ -183,53 +501,55 @@ class ModelSessionManager:
             return reference_audio, reference_text
 
         try:
-            available_samples = []
-
-            if len(filter_options) == 0:
-                available_samples = [(sample, idx) for idx, sample in enumerate(self.sample_metadata)]
-            else:
-                for idx, sample in enumerate(self.sample_metadata):
-                    if all(sample[key] == value for key, value in filter_options.items()):
-                        available_samples.append((sample, idx))
-            
-            if len(available_samples) == 0:
-                sample, sample_idx = self.sample_metadata[0], 0
-            else:
-                # Create a consistent cache key based on filter options
-                cache_key = f"{gender}_{group}_{area}_{emotion}_{self.config.random_seed}"
-                
-                # Use consistent sample selection based on configuration seed and filter options
-                # This ensures all chunks with same parameters use the same sample for voice consistency
-                if not hasattr(self, '_cached_sample_choices'):
-                    self._cached_sample_choices = {}
-                
-                if cache_key not in self._cached_sample_choices:
-                    # Use a deterministic seed based on the cache key for consistency
-                    import hashlib
-                    seed_string = f"{cache_key}_{len(available_samples)}"
-                    deterministic_seed = int(hashlib.md5(seed_string.encode()).hexdigest()[:8], 16) % (2**31)
-                    
-                    random.seed(deterministic_seed)
-                    self._cached_sample_choices[cache_key] = random.choice(available_samples)
-                    random.seed()  # Reset seed to avoid affecting other random operations
-                
-                sample, sample_idx = self._cached_sample_choices[cache_key]
+            sample_idx = self._pick_sample_idx(gender, group, area, emotion, self.config.random_seed)
+            sample = self.sample_metadata[sample_idx]
 
             print(f"Selected sample #{sample_idx} with gender: {sample['gender']}, group: {sample['group']}, area: {sample['area']}, emotion: {sample['emotion']}")
 
-            # Get the cached model path
-            model_path = self.config.ensure_model_downloaded()
-            
-            with tarfile.open(model_path, 'r') as tar:
-                ref_audio = tar.extractfile("cleaned_audios/" + sample["file_name"])
-                if not ref_audio:
-                    raise FileNotFoundError(f"Audio file {sample['file_name']} not found in model archive")
-                ref_audio = ref_audio.read()
-                ref_text = sample["text"]
+            ref_audio = self._map_reference_audio(sample["file_name"])
+            if ref_audio is None:
+                raise FileNotFoundError(f"Audio file {sample['file_name']} not found in model archive")
+            ref_text = sample["text"]
+            del sample
         except KeyError:
             raise ValueError(f"Sample not found for gender: {gender}, group: {group}, area: {area}, emotion: {emotion}")
         return ref_audio, ref_text
     
+    def _map_reference_audio(self, file_name: str) -> Optional[memoryview]:
+        """Read-only view of a memory-mapped extracted reference audio (None if not in the archive)"""
+        audio_path = self._audio_paths.get(file_name)
+        if audio_path is None:
+            return None
+        with open(audio_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b'')
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+    
+    def _pick_sample_idx(self, *key: Any) -> int:
+        """Memoized _choose_sample_idx"""
+        sample_idx = self._sample_choices.get(key)
+        if sample_idx is None:
+            # Choices are deterministic, so dropping them all when full only costs recomputation
+            if len(self._sample_choices) >= SAMPLE_CHOICE_CACHE_SIZE:
+                self._sample_choices.clear()
+            sample_idx = self._sample_choices[key] = self._choose_sample_idx(*key)
+        return sample_idx
+    
+    def _choose_sample_idx(self, gender: Optional[str], group: Optional[str],
+                           area: Optional[str], emotion: Optional[str], seed: int) -> int:
+        """Deterministically choose a sample index for a filter combination"""
+        available_samples = self._sample_index.get((gender, group, area, emotion), [])
+        if len(available_samples) == 0:
+            return 0
+        
+        # Use a deterministic seed based on the filter options and configuration seed
+        seed_string = f"{gender}_{group}_{area}_{emotion}_{seed}_{len(available_samples)}"
+        seed_digest = hashlib.blake2b(seed_string.encode(), digest_size=4).digest()
+        deterministic_seed = int.from_bytes(seed_digest, 'big') & 0x7fffffff
+        
+        # Local generator, the process-wide random state is left untouched
+        return random.Random(deterministic_seed).choice(available_samples)
+    
     def _select_english_sample(self, voice_id: Optional[str] = None) -> Tuple[str, str]:
         """Select English sample based on voice_id (adam, aria, alice, brian, callum)"""
         # Mapping voice_id to actual sample data
@@ -256,29 +576,30 @@ class ModelSessionManager:
             return ref_audio, ref_text
         else:
             # Fallback to placeholder if file not found
-            print(f"Warning: Audio file {audio_file_path} not found, creating placeholder")
-            # Create a temporary placeholder audio file
-            import tempfile
-            import wave
-            import struct
-            
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.wav')
-            try:
-                with wave.open(temp_path, 'wb') as wf:
-                    wf.setnchannels(1)  # mono
-                    wf.setsampwidth(2)  # 16-bit
-                    wf.setframerate(24000)  # 24kHz
-                    # Create 2 seconds of silence
-                    silence_frames = 24000 * 2
-                    silence_data = struct.pack('<' + ('h' * silence_frames), *([0] * silence_frames))
-                    wf.writeframes(silence_data)
-                ref_audio = temp_path
-                ref_text = voice_data['text']
-                print(f"Created placeholder audio file: {temp_path}")
-            finally:
-                os.close(temp_fd)
+            print(f"Warning: Audio file {audio_file_path} not found, using placeholder")
+            ref_audio = self._get_silence_wav()
+            ref_text = voice_data['text']
             return ref_audio, ref_text
     
+    @classmethod
+    def _get_silence_wav(cls) -> str:
+        """Path of a shared 2 second silent placeholder WAV, written on first use"""
+        with cls._silence_lock:
+            if cls._silence_wav_path is None or not Path(cls._silence_wav_path).exists():
+                temp_fd, temp_path = tempfile.mkstemp(suffix='.wav')
+                try:
+                    with wave.open(temp_path, 'wb') as wf:
+                        wf.setnchannels(1)  # mono
+                        wf.setsampwidth(2)  # 16-bit
+                        wf.setframerate(24000)  # 24kHz
+                        # Create 2 seconds of silence
+                        wf.writeframes(np.zeros(24000 * 2, dtype=np.int16).tobytes())
+                finally:
+                    os.close(temp_fd)
+                cls._silence_wav_path = temp_path
+                print(f"Created placeholder audio file: {temp_path}")
+            return cls._silence_wav_path
+    
     def cleanup(self) -> None:
         """Clean up resources"""
         if self.sessions:
@@ -290,19 +611,28 @@ class ModelSessionManager:
                         pass
             self.sessions.clear()
         
-        if self.temp_dir and Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
-            self.temp_dir = None
-            self.vocab_path = None
+        self._binding_local = threading.local()
+        self._audio_paths.clear()
+        
+        self._remove_temp_dir()
         
         # Clear cached sample choices to allow new sample selection
-        if hasattr(self, '_cached_sample_choices'):
-            delattr(self, '_cached_sample_choices')
+        self._sample_choices.clear()
+    
+    def _remove_temp_dir(self) -> None:
+        """Delete the extraction directory (runs the finalizer so it fires only once)"""
+        if self._temp_dir_finalizer is not None:
+            self._temp_dir_finalizer()
+            self._temp_dir_finalizer = None
+        self.temp_dir = None
+        self.vocab_path = None
     
     def reset_sample_cache(self):
         """Reset cached sample choices to allow new sample selection"""
-        if hasattr(self, '_cached_sample_choices'):
-            delattr(self, '_cached_sample_choices')
+        self._sample_choices.clear()
+    
+    def __enter__(self):
+        return self
     
-    def __del__(self):
-        self.cleanup() 
\ No newline at end of file
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
\ No newline at end of file
@@ -6,7 +6,9 @@ Keeps models loaded in memory to avoid reloading on each API call
 import threading
 import time
 import weakref
-from typing import Dict, Optional, Any, Tuple
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 import logging
 
@@ -58,9 +60,12 @@ class GlobalModelCache:
         if self._initialized:
             return
             
-        self._cache: Dict[str, ModelCacheEntry] = {}
+        self._cache: "OrderedDict[str, ModelCacheEntry]" = OrderedDict()  # LRU order, oldest first
         self._cache_lock = threading.RLock()
+        self._loading: Dict[str, Future] = {}  # In-flight loads, waited on outside the lock
         self._cleanup_thread = None
+        # Evicted models are torn down here so the cache lock is not held through it
+        self._gc_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-cache-gc")
         self._running = True
         self._max_cache_size = 5  # Maximum number of models to keep in memory
         self._max_idle_time = 1800  # 30 minutes idle time before cleanup
@@ -72,13 +77,7 @@ class GlobalModelCache:
     
     def _generate_cache_key(self, config: ModelConfig) -> str:
         """Generate a unique cache key for the model configuration"""
-        key_parts = [
-            config.language,
-            str(config.use_gpu),
-            str(config.gpu_id) if config.gpu_id is not None else "auto",
-            config.model_path or "default"
-        ]
-        return "|".join(key_parts)
+        return config.cache_key
     
     def get_model(self, config: ModelConfig) -> ModelSessionManager:
         """Get a model from cache or create a new one"""
@@ -89,46 +88,69 @@ class GlobalModelCache:
             if cache_key in self._cache:
                 entry = self._cache[cache_key]
                 entry.access()
+                self._cache.move_to_end(cache_key)
                 logger.info(f"Retrieved cached model: {cache_key} (accessed {entry.access_count} times)")
                 return entry.model_session_manager
             
-            # Create new model if not in cache
+            # Join a load already in progress for this key
+            loading = self._loading.get(cache_key)
+            if loading is None:
+                loading = Future()
+                self._loading[cache_key] = loading
+                is_loader = True
+            else:
+                is_loader = False
+        
+        if not is_loader:
+            logger.info(f"Waiting for in-flight model load: {cache_key}")
+            return loading.result()
+        
+        # Create new model outside the lock so other keys are not blocked
+        try:
             logger.info(f"Creating new model for cache key: {cache_key}")
             start_time = time.time()
             
             model_session_manager = ModelSessionManager(config)
-            model_session_manager.load_models()
+            model_session_manager.load_models(warmup=True)
             
             load_time = time.time() - start_time
             logger.info(f"Model loaded in {load_time:.2f}s")
-            
+        except BaseException as e:
+            with self._cache_lock:
+                del self._loading[cache_key]
+            loading.set_exception(e)
+            raise
+        
+        with self._cache_lock:
             # Add to cache
             entry = ModelCacheEntry(model_session_manager, config)
             self._cache[cache_key] = entry
+            del self._loading[cache_key]
             
             # Cleanup old entries if cache is full
-            self._cleanup_if_needed()
-            
-            return model_session_manager
-    
-    def _cleanup_if_needed(self):
-        """Clean up cache if it's getting too full"""
-        if len(self._cache) <= self._max_cache_size:
-            return
-        
-        # Sort by last accessed time (oldest first)
-        sorted_entries = sorted(
-            self._cache.items(),
-            key=lambda x: x[1].last_accessed
-        )
+            evicted = self._cleanup_if_needed()
         
-        # Remove oldest entries
-        entries_to_remove = len(self._cache) - self._max_cache_size
-        for i in range(entries_to_remove):
-            cache_key, entry = sorted_entries[i]
+        # Waiters are released before any teardown, so a failing teardown cannot strand them
+        loading.set_result(model_session_manager)
+        for entry in evicted:
+            self._dispose(entry)
+        return model_session_manager
+    
+    def _cleanup_if_needed(self) -> List[ModelCacheEntry]:
+        """Remove least recently used entries beyond the cache size; returns them for _dispose"""
+        evicted = []
+        while len(self._cache) > self._max_cache_size:
+            cache_key, entry = self._cache.popitem(last=False)
             logger.info(f"Removing old cache entry: {cache_key}")
+            evicted.append(entry)
+        return evicted
+    
+    def _dispose(self, entry: ModelCacheEntry):
+        """Tear down a removed entry on the GC thread, or inline once the cache is shut down"""
+        try:
+            self._gc_executor.submit(entry.cleanup)
+        except RuntimeError:
             entry.cleanup()
-            del self._cache[cache_key]
     
     def _start_cleanup_thread(self):
         """Start background cleanup thread"""
@@ -142,10 +164,9 @@ class GlobalModelCache:
                                 stale_keys.append(cache_key)
                         
                         for cache_key in stale_keys:
-                            entry = self._cache[cache_key]
+                            entry = self._cache.pop(cache_key)
                             logger.info(f"Cleaning up stale cache entry: {cache_key}")
-                            entry.cleanup()
-                            del self._cache[cache_key]
+                            self._dispose(entry)
                     
                     # Sleep for 5 minutes before next cleanup
                     time.sleep(300)
@@ -191,6 +212,7 @@ class GlobalModelCache:
         if self._cleanup_thread and self._cleanup_thread.is_alive():
             self._cleanup_thread.join(timeout=5)
         self.clear_cache()
+        self._gc_executor.shutdown(wait=True)
         logger.info("Global model cache shutdown")
 
 
@@ -3,12 +3,40 @@ Configuration management for TTS inference with multilingual support
 """
 
 import os
+import re
+import sys
+import mmap
+import hashlib
+import threading
 import urllib.request
 import urllib.error
+import urllib.parse
 import ssl
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, List, Mapping, Tuple
+
+try:
+    import hf_transfer  # noqa: F401 - enables the multi-connection downloader in huggingface_hub
+    HF_TRANSFER_AVAILABLE = True
+    # huggingface_hub reads this once at import; set it before importing, an explicit setting wins
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+except ImportError:
+    HF_TRANSFER_AVAILABLE = False
+
+try:
+    from huggingface_hub import hf_hub_download
+    HF_HUB_AVAILABLE = True
+except ImportError:
+    HF_HUB_AVAILABLE = False
+
+try:
+    import urllib3
+    URLLIB3_AVAILABLE = True
+except ImportError:
+    URLLIB3_AVAILABLE = False
 
 
 # Model constants
@@ -20,6 +48,10 @@ MODEL_EMOTION = ["neutral", "serious", "monotone", "sad", "surprised", "happy",
 # Language support constants
 MODEL_LANGUAGES = ["vietnamese", "english"]
 MODEL_ENGLISH_ACCENTS = ["american", "british", "australian"]
+DEFAULT_PRELOAD_LANGUAGES = ["vietnamese"]
+
+# Project root that relative (English) model cache dirs are resolved against
+_PROJECT_ROOT = Path(__file__).parent.parent.parent
 
 # Language-specific configurations
 LANGUAGE_CONFIGS = {
@@ -36,6 +68,78 @@ LANGUAGE_CONFIGS = {
         "default_model_url": "https://huggingface.co/F5-TTS/F5-TTS/resolve/main/F5TTS_Base/model_1000000.pt"
     }
 }
+# Language-specific voice parameters (read-only, shared by all configs)
+LANGUAGE_PARAMS = {
+    "vietnamese": MappingProxyType({
+        "voice_params": ("gender", "group", "area", "emotion"),
+        "areas": tuple(MODEL_AREA),
+        "default_area": "northern"
+    }),
+    "english": MappingProxyType({
+        "voice_params": ("gender", "group", "accent", "emotion"),
+        "accents": tuple(MODEL_ENGLISH_ACCENTS),
+        "default_accent": "american"
+    })
+}
+_NO_LANGUAGE_PARAMS = MappingProxyType({})
+
+# Parallel byte-range download settings
+DOWNLOAD_PARTS = 8
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+
+class RangeNotSupportedError(Exception):
+    """Server answered a ranged request with the full body"""
+
+
+# Shared per process so the trust store is loaded and connections are pooled once
+_ssl_contexts: Dict[bool, ssl.SSLContext] = {}
+_http_pools: Dict[bool, Any] = {}
+_network_lock = threading.RLock()
+
+
+def get_ssl_context(verify: bool = True) -> ssl.SSLContext:
+    """Shared SSL context, certificate verification disabled if verify is False"""
+    with _network_lock:
+        context = _ssl_contexts.get(verify)
+        if context is None:
+            context = ssl.create_default_context()
+            if not verify:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            _ssl_contexts[verify] = context
+        return context
+
+
+def get_http_pool(verify: bool = True):
+    """Shared keep-alive urllib3 pool (None if urllib3 is not installed)"""
+    if not URLLIB3_AVAILABLE:
+        return None
+    with _network_lock:
+        pool = _http_pools.get(verify)
+        if pool is None:
+            pool = urllib3.PoolManager(
+                maxsize=DOWNLOAD_PARTS,
+                ssl_context=get_ssl_context(verify),
+                cert_reqs="CERT_REQUIRED" if verify else "CERT_NONE",
+                assert_hostname=None if verify else False
+            )
+            _http_pools[verify] = pool
+        return pool
+
+
+def parse_hf_url(url: Optional[str]) -> Optional[Tuple[str, str, str]]:
+    """Split a huggingface.co resolve URL into (repo_id, revision, filename)"""
+    if not url:
+        return None
+    parsed = urllib.parse.urlparse(url)
+    if parsed.netloc != "huggingface.co":
+        return None
+    parts = parsed.path.strip("/").split("/")
+    # <owner>/<repo>/resolve/<revision>/<path/to/file>
+    if len(parts) < 5 or parts[2] != "resolve":
+        return None
+    return f"{parts[0]}/{parts[1]}", parts[3], "/".join(parts[4:])
 
 
 @dataclass
@@ -49,6 +153,7 @@ class ModelConfig:
     model_url: Optional[str] = None  # Will be set based on language if not provided
     model_cache_dir: Optional[str] = None  # Will be set based on language if not provided
     model_filename: Optional[str] = None  # Will be set based on language if not provided
+    model_sha256: Optional[str] = None  # Expected SHA-256 of the model archive (hex), verified once per download
     
     # Alternative model paths for multilingual setup
     vietnamese_model_path: str = "~/.cache/vietvoicetts"
@@ -76,7 +181,9 @@ class ModelConfig:
     preferred_gpu_id: Optional[int] = None  # None for auto-selection, 0 or 1 for specific GPU
     use_gpu_load_balancing: bool = True  # Enable automatic GPU load balancing
     enable_model_caching: bool = True  # Enable model session caching
+    warmup_sessions: bool = False  # Run one max-length inference after loading (cached models always do)
     max_concurrent_requests: int = 10  # Maximum concurrent requests
+    preload_languages: List[str] = field(default_factory=lambda: list(DEFAULT_PRELOAD_LANGUAGES))  # Others load on first use
     
     # ONNX Runtime settings
     log_severity_level: int = 4
@@ -84,6 +191,48 @@ class ModelConfig:
     inter_op_num_threads: int = 0
     intra_op_num_threads: int = 0
     enable_cpu_mem_arena: bool = True
+    gpu_mem_limit: int = 0  # CUDA arena limit in bytes (0 for no limit)
+    use_int8_on_cpu: bool = True  # Prefer INT8 quantized models from the archive on CPU
+
+    # Fields the memoized model path and cache key are derived from
+    _MODEL_PATH_FIELDS = frozenset(("language", "model_cache_dir", "model_filename"))
+    _CACHE_KEY_FIELDS = _MODEL_PATH_FIELDS | {"use_gpu", "gpu_id"}
+    # Model paths already validated in this process (shared across instances)
+    _validated_paths = set()
+    # Shared hub cache blobs already hashed in this process
+    _verified_hub_files = set()
+
+    def __setattr__(self, name, value):
+        if name == "pause_punctuation":
+            object.__setattr__(self, "_pause_re", None)
+        elif name in self._CACHE_KEY_FIELDS:
+            object.__setattr__(self, "_cache_key", None)
+            if name in self._MODEL_PATH_FIELDS:
+                object.__setattr__(self, "_model_path", None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def cache_key(self) -> str:
+        """Model cache key, computed once and recomputed only when a key field changes"""
+        key = self.__dict__.get("_cache_key")
+        if key is None:
+            key = sys.intern("|".join((
+                self.language,
+                str(self.use_gpu),
+                str(self.gpu_id) if self.gpu_id is not None else "auto",
+                self.model_path or "default"
+            )))
+            object.__setattr__(self, "_cache_key", key)
+        return key
+
+    @property
+    def pause_regex(self) -> "re.Pattern":
+        """Compiled pause_punctuation pattern, compiled once per value"""
+        pattern = self.__dict__.get("_pause_re")
+        if pattern is None:
+            pattern = re.compile(self.pause_punctuation)
+            object.__setattr__(self, "_pause_re", pattern)
+        return pattern
 
     def __post_init__(self):
         """Post-initialization validation with multilingual support"""
@@ -121,92 +270,263 @@ class ModelConfig:
     
     @property
     def model_path(self) -> str:
-        """Get the full path to the cached model file"""
-        if self.language == "english" and not self.model_cache_dir.startswith("/"):
-            # For English, use relative path from project root
-            project_root = Path(__file__).parent.parent.parent
-            return str(project_root / self.model_cache_dir / self.model_filename)
-        else:
-            from pathlib import Path
-            cache_dir = Path(self.model_cache_dir).expanduser()
-            return str(cache_dir / self.model_filename)
+        """Get the full path to the cached model file (memoized until a path field changes)"""
+        model_path = self.__dict__.get("_model_path")
+        if model_path is None:
+            if self.language == "english" and not self.model_cache_dir.startswith("/"):
+                # For English, use relative path from project root
+                model_path = str(_PROJECT_ROOT / self.model_cache_dir / self.model_filename)
+            else:
+                cache_dir = Path(self.model_cache_dir).expanduser()
+                model_path = str(cache_dir / self.model_filename)
+            object.__setattr__(self, "_model_path", model_path)
+        return model_path
     
-    def get_language_specific_params(self) -> Dict[str, Any]:
-        """Get language-specific parameters for voice synthesis"""
-        if self.language == "vietnamese":
-            return {
-                "voice_params": ["gender", "group", "area", "emotion"],
-                "areas": MODEL_AREA,
-                "default_area": "northern"
-            }
-        elif self.language == "english":
-            return {
-                "voice_params": ["gender", "group", "accent", "emotion"],
-                "accents": MODEL_ENGLISH_ACCENTS,
-                "default_accent": "american"
-            }
-        return {}
+    def get_language_specific_params(self) -> Mapping[str, Any]:
+        """Get language-specific parameters for voice synthesis (read-only)"""
+        return LANGUAGE_PARAMS.get(self.language, _NO_LANGUAGE_PARAMS)
     
-    def _create_ssl_context(self):
-        """Create SSL context for secure downloads with fallback options"""
+    def _stream_download(self, url: str, file_path: Path, progress_hook=None, verify: bool = True):
+        """Download over a single connection in DOWNLOAD_CHUNK_SIZE pieces"""
+        pool = get_http_pool(verify)
+        if pool is not None:
+            response = pool.request("GET", url, preload_content=False)
+            try:
+                if response.status >= 400:
+                    raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+                self._write_chunks(response.stream(DOWNLOAD_CHUNK_SIZE), file_path, progress_hook,
+                                   int(response.headers.get("Content-Length") or 0))
+            finally:
+                response.release_conn()
+        else:
+            with urllib.request.urlopen(url, context=get_ssl_context(verify)) as response:
+                self._write_chunks(self._readinto_chunks(response), file_path, progress_hook,
+                                   int(response.headers.get("Content-Length") or 0))
+    
+    @staticmethod
+    def _readinto_chunks(response):
+        """Read a response into one reused DOWNLOAD_CHUNK_SIZE buffer, yielding views of it"""
+        buffer = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buffer)
         try:
-            # Try to create default SSL context first
-            context = ssl.create_default_context()
-            return context
-        except Exception:
-            # If default context fails, create unverified context as fallback
-            print("⚠️  Warning: Using unverified SSL context due to certificate issues")
-            context = ssl.create_default_context()
-            context.check_hostname = False
-            context.verify_mode = ssl.CERT_NONE
-            return context
+            while True:
+                read = response.readinto(buffer)
+                if not read:
+                    break
+                yield view[:read]
+        finally:
+            view.release()
+    
+    @staticmethod
+    def _write_chunks(chunks, file_path: Path, progress_hook, total_size: int):
+        """Write a chunk stream to disk, reporting progress"""
+        downloaded = 0
+        with open(file_path, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                downloaded += len(chunk)
+                if progress_hook:
+                    progress_hook(downloaded, 1, total_size)
+    
+    def _parallel_download(self, url: str, file_path: Path, progress_hook=None,
+                           parts: int = DOWNLOAD_PARTS) -> bool:
+        """
+        Download a file as parallel byte ranges written straight into a preallocated mmap
+        
+        Returns:
+            False if the server does not support ranged requests (nothing downloaded)
+        """
+        ssl_context = get_ssl_context()
+        
+        head = urllib.request.Request(url, method="HEAD")
+        with urllib.request.urlopen(head, context=ssl_context) as response:
+            final_url = response.geturl()  # Follow redirects once, e.g. to the CDN
+            total_size = int(response.headers.get("Content-Length") or 0)
+            accept_ranges = response.headers.get("Accept-Ranges", "")
+        
+        if total_size <= 0 or accept_ranges.lower() != "bytes":
+            return False
+        
+        part_size = -(-total_size // parts)
+        ranges = [(lo, min(lo + part_size, total_size) - 1) for lo in range(0, total_size, part_size)]
+        downloaded = [0]
+        progress_lock = threading.Lock()
+        
+        with open(file_path, "wb+") as f:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, total_size)
+            else:
+                f.truncate(total_size)
+            
+            with mmap.mmap(f.fileno(), total_size) as mm:
+                view = memoryview(mm)
+                
+                def fetch(byte_range):
+                    lo, hi = byte_range
+                    request = urllib.request.Request(final_url, headers={"Range": f"bytes={lo}-{hi}"})
+                    with urllib.request.urlopen(request, context=ssl_context) as response:
+                        if response.status != 206:
+                            raise RangeNotSupportedError(f"HTTP {response.status} for ranged request")
+                        offset = lo
+                        while offset <= hi:
+                            read = response.readinto(view[offset:min(offset + DOWNLOAD_CHUNK_SIZE, hi + 1)])
+                            if not read:
+                                raise urllib.error.URLError(f"Connection closed at byte {offset} of {hi}")
+                            offset += read
+                            if progress_hook:
+                                with progress_lock:
+                                    downloaded[0] += read
+                                    progress_hook(downloaded[0], 1, total_size)
+                
+                try:
+                    with ThreadPoolExecutor(max_workers=len(ranges), thread_name_prefix="model-download") as executor:
+                        list(executor.map(fetch, ranges))
+                except RangeNotSupportedError:
+                    return False
+                finally:
+                    view.release()
+        
+        return True
     
     def _download_with_ssl_fallback(self, url: str, file_path: Path, progress_hook=None):
         """Download file with SSL fallback mechanism"""
-        # Method 1: Try with default SSL context
+        # Method 1: Parallel byte-range download, falls through when ranges are unsupported
+        try:
+            print(f"⚡ Attempting parallel download ({DOWNLOAD_PARTS} connections)...")
+            if self._parallel_download(url, file_path, progress_hook):
+                print(f"\n✅ Parallel download successful!")
+                return
+            print("ℹ️  Server does not support ranged requests, using single connection")
+        except Exception as e:
+            print(f"\n⚠️  Parallel download failed: {e}")
+        
+        # Method 2: Single connection with the shared verified SSL context
         try:
             print("🔐 Attempting secure download...")
-            urllib.request.urlretrieve(url, file_path, progress_hook)
+            self._stream_download(url, file_path, progress_hook)
             print(f"\n✅ Secure download successful!")
             return
-        except urllib.error.URLError as e:
+        except Exception as e:
             if "SSL" in str(e) or "CERTIFICATE" in str(e):
                 print(f"🔒 SSL error encountered: {e}")
-                print("🔄 Trying with custom SSL context...")
+                print("🔄 Trying without certificate verification...")
             else:
                 raise e
         
-        # Method 2: Try with custom SSL context
-        try:
-            ssl_context = self._create_ssl_context()
-            opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl_context))
-            urllib.request.install_opener(opener)
-            urllib.request.urlretrieve(url, file_path, progress_hook)
-            print(f"\n✅ Download successful with custom SSL context!")
-            return
-        except Exception as e:
-            print(f"❌ Custom SSL context failed: {e}")
-        
         # Method 3: Last resort - unverified SSL (not recommended for production)
         try:
             print("⚠️  Attempting unverified download (not recommended for production)...")
-            ssl_context = ssl.create_default_context()
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
-            
-            opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=ssl_context))
-            urllib.request.install_opener(opener)
-            urllib.request.urlretrieve(url, file_path, progress_hook)
+            self._stream_download(url, file_path, progress_hook, verify=False)
             print(f"\n⚠️  Download completed with unverified SSL!")
             print("📋 Please update your system certificates for better security.")
             return
         except Exception as e:
             raise RuntimeError(f"All download methods failed. Last error: {e}")
     
+    @staticmethod
+    def _hash_sidecar_path(model_path: Path) -> Path:
+        """Sidecar file holding the verified SHA-256 of a downloaded model"""
+        return model_path.with_suffix(".sha256")
+    
+    @staticmethod
+    def _file_sha256(file_path: Path) -> str:
+        """SHA-256 of a file, streamed in DOWNLOAD_CHUNK_SIZE pieces"""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for chunk in iter(lambda: f.read(DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _record_model_hash(self, model_path: Path, file_path: Optional[Path] = None):
+        """
+        Hash a freshly downloaded model, check it against model_sha256 and write the sidecar
+        
+        Args:
+            model_path: Final model location, the sidecar is written next to it
+            file_path: File to hash if not yet moved to model_path (e.g. the .part download)
+        """
+        actual = self._file_sha256(file_path or model_path)
+        if self.model_sha256 and actual != self.model_sha256.lower():
+            raise RuntimeError(f"SHA-256 mismatch for {model_path}: expected {self.model_sha256}, got {actual}")
+        self._hash_sidecar_path(model_path).write_text(actual)
+    
+    def _cached_model_valid(self, model_path: Path) -> bool:
+        """
+        Check a cached model archive without rehashing it when possible
+        
+        A sidecar is only written once a download has been hashed, so its presence is trusted.
+        A file without one is unverified: it is hashed against model_sha256 when configured
+        and treated as invalid otherwise.
+        """
+        sidecar = self._hash_sidecar_path(model_path)
+        if sidecar.exists():
+            return not self.model_sha256 or sidecar.read_text().strip() == self.model_sha256.lower()
+        if not self.model_sha256:
+            print(f"⚠️  No recorded hash for {model_path}, treating it as unverified")
+            return False
+        try:
+            self._record_model_hash(model_path)
+        except RuntimeError as e:
+            print(f"⚠️  {e}")
+            return False
+        return True
+    
+    def _verify_hub_file(self, file_path: Path):
+        """
+        Check a file in a shared hub cache, hashing each blob at most once per process
+        
+        The expected hash is model_sha256, or the blob name itself: the hub stores LFS files
+        under their SHA-256. Shared files are never deleted here, a mismatch raises instead.
+        """
+        blob = file_path.resolve()
+        if blob in ModelConfig._verified_hub_files:
+            return
+        expected = (self.model_sha256 or "").lower()
+        if not expected and re.fullmatch(r"[0-9a-f]{64}", blob.name):
+            expected = blob.name
+        if not expected:
+            raise RuntimeError(f"Cannot verify {file_path}: no model_sha256 configured and not an LFS blob")
+        actual = self._file_sha256(blob)
+        if actual != expected:
+            raise RuntimeError(f"SHA-256 mismatch for {file_path}: expected {expected}, got {actual}")
+        ModelConfig._verified_hub_files.add(blob)
+    
+    def _download_from_hub(self, model_path: Path) -> Optional[str]:
+        """Download the model through huggingface_hub with hf_transfer, None if unavailable"""
+        hub_file = parse_hf_url(self.model_url)
+        if not (HF_HUB_AVAILABLE and HF_TRANSFER_AVAILABLE) or hub_file is None:
+            return None
+        
+        repo_id, revision, filename = hub_file
+        
+        # A shared hub cache (e.g. on NFS) is used in place, otherwise download into the model cache dir
+        shared_cache = os.environ.get("HUGGINGFACE_HUB_CACHE")
+        if shared_cache:
+            try:
+                downloaded = hf_hub_download(repo_id, filename, revision=revision,
+                                             cache_dir=shared_cache, local_files_only=True)
+            except Exception:
+                print(f"🚀 Downloading {repo_id}/{filename} into shared hub cache {shared_cache} (hf_transfer)")
+                downloaded = hf_hub_download(repo_id, filename, revision=revision, cache_dir=shared_cache)
+            self._verify_hub_file(Path(downloaded))
+            return downloaded
+        
+        if Path(filename).name != model_path.name:
+            return None
+        print(f"🚀 Downloading {repo_id}/{filename} (hf_transfer)")
+        downloaded = hf_hub_download(repo_id, filename, revision=revision, local_dir=str(model_path.parent))
+        # Nested repo paths land in subdirectories of local_dir
+        if Path(downloaded) != model_path:
+            os.replace(downloaded, model_path)
+        try:
+            self._record_model_hash(model_path)
+        except RuntimeError:
+            model_path.unlink()
+            raise
+        return str(model_path)
+    
     def ensure_model_downloaded(self) -> str:
         """Ensure model is downloaded and cached, return path to model file"""
-        print(f"[DEBUG] ensure_model_downloaded: language={self.language}, model_path={self.model_path}")
-        
         model_path = Path(self.model_path)
         cache_dir = model_path.parent
         
@@ -221,18 +541,37 @@ class ModelConfig:
         
         # For Vietnamese, keep original logic
         cache_dir.mkdir(parents=True, exist_ok=True)
+        if model_path.exists() and not self._cached_model_valid(model_path):
+            print(f"🧹 Removing corrupt cached model: {model_path}")
+            model_path.unlink()
+            self._hash_sidecar_path(model_path).unlink(missing_ok=True)
         if not model_path.exists():
+            try:
+                hub_path = self._download_from_hub(model_path)
+            except Exception as e:
+                print(f"⚠️  Hub download failed, falling back to direct download: {e}")
+                hub_path = None
+            if hub_path is not None:
+                print(f"✅ Model available at {hub_path}")
+                return hub_path
+            
             print(f"📥 Downloading model from {self.model_url}")
             print(f"💾 Saving to {model_path}")
+            part_path = model_path.with_suffix(".part")
             try:
                 def progress_hook(block_num, block_size, total_size):
                     if total_size > 0:
                         percent = min(100, (block_num * block_size * 100) // total_size)
                         print(f"\r📊 Downloading: {percent}%", end='', flush=True)
-                self._download_with_ssl_fallback(self.model_url, model_path, progress_hook)
+                # Written under a .part name and moved into place only once complete, so an
+                # interrupted download never leaves a truncated or zero-filled archive behind
+                self._download_with_ssl_fallback(self.model_url, part_path, progress_hook)
+                self._record_model_hash(model_path, part_path)
+                os.replace(part_path, model_path)
             except Exception as e:
-                if model_path.exists():
-                    model_path.unlink()
+                if part_path.exists() or model_path.exists():
+                    part_path.unlink(missing_ok=True)
+                    model_path.unlink(missing_ok=True)
                     print(f"🧹 Cleaned up partial download")
                 error_msg = f"Failed to download model from {self.model_url}: {e}"
                 suggestions = [
@@ -240,7 +579,7 @@ class ModelConfig:
                     "2. Verify the model URL is accessible",
                     "3. Check if you're behind a corporate firewall",
                     "4. Try updating system certificates: sudo apt-get update && sudo apt-get install ca-certificates",
-                    "5. Consider downloading the model manually and placing it in the cache directory"
+                    "5. Consider downloading the model manually, placing it in the cache directory and setting model_sha256"
                 ]
                 full_error = f"{error_msg}\n\nTroubleshooting suggestions:\n" + "\n".join(suggestions)
                 raise RuntimeError(full_error)
@@ -250,12 +589,15 @@ class ModelConfig:
     
     def validate_paths(self):
         """Validate that required files exist or can be downloaded"""
-        print(f"[DEBUG] validate_paths: language={self.language}, model_path={self.model_path}")
+        model_path = self.model_path
+        if model_path in ModelConfig._validated_paths:
+            return
         try:
             # Ensure model is available (download if needed for Vietnamese, check existence for English)
             self.ensure_model_downloaded()
         except Exception as e:
             raise RuntimeError(f"Model validation failed: {e}")
+        ModelConfig._validated_paths.add(model_path)
     
     def validate_with_reference_audio(self, reference_audio_path: str) -> bool:
         """Validate configuration against a reference audio file"""
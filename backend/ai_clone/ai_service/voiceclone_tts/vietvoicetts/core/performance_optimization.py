@@ -4,15 +4,23 @@ This file implements advanced caching and preloading strategies
 """
 
 import asyncio
+import functools
 import time
 import threading
+import itertools
+from collections import defaultdict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import TYPE_CHECKING, Dict, Any, Iterator, Optional, List, Tuple
 import logging
 
-from ..core.model_config import ModelConfig
-from ..core.model import ModelSessionManager
-from ..core.english_tts_engine import EnglishTTSEngine
+from ..core.model_config import ModelConfig, DEFAULT_PRELOAD_LANGUAGES
+
+# Engines pull in ONNX Runtime / torch / F5-TTS, imported where first used
+if TYPE_CHECKING:
+    from ..core.model import ModelSessionManager
+    from ..core.english_tts_engine import EnglishTTSEngine
 
 logger = logging.getLogger(__name__)
 
@@ -21,31 +29,61 @@ class OptimizedModelManager:
     
     _instance = None
     _lock = threading.RLock()
-    _initialized = False
     
     def __new__(cls):
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
-                cls._instance = super().__new__(cls)
+                instance = super().__new__(cls)
+                instance._init_state()
+                cls._instance = instance
             return cls._instance
     
-    def __init__(self):
-        if self._initialized:
-            return
-            
-        self._models: Dict[str, ModelSessionManager] = {}
-        self._english_engines: Dict[str, EnglishTTSEngine] = {}
+    def _init_state(self):
+        """One-time initialization, run by __new__ before the instance is published"""
+        # Copy-on-write maps: readers use the current dict without locking, writers swap
+        # in an updated copy under _preload_lock
+        self._models: Dict[str, "ModelSessionManager"] = {}
+        self._english_engines: Dict[str, "EnglishTTSEngine"] = {}
+        # On-demand models are bounded: LRU by access stamp, preloaded defaults are never evicted
+        self._capacity = ModelConfig.max_concurrent_requests
+        self._last_access: Dict[str, int] = {}
+        self._access_clock = itertools.count()
+        self._pinned_keys = set()
+        # In-flight users per leased manager; evicted managers still leased wait in _retired
+        # and are cleaned up when their last lease is released
+        self._leases: Dict["ModelSessionManager", int] = {}
+        self._retired = set()
         self._preload_tasks: Dict[str, asyncio.Task] = {}
         self._warm_up_complete = False
         self._preload_lock = threading.RLock()
         self._preload_started = False
-        
-        self._initialized = True
+        self._load_pool = self._new_load_pool()
+        # Loads submitted to _load_pool and not finished yet, cancelled by clear_cache()
+        self._pending_loads = set()
         
         logger.info("OptimizedModelManager initialized (preloading will start on first request)")
     
-    def ensure_preloading_started(self):
-        """Ensure background preloading has started (safe to call from sync context)"""
+    @staticmethod
+    def _new_load_pool() -> ThreadPoolExecutor:
+        """Dedicated pool for heavy model loads, kept off the event loop's default executor"""
+        return ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts-modelload")
+    
+    def _submit_load(self, fn) -> asyncio.Future:
+        """Run a model load on the load pool, awaitable from the event loop"""
+        future = self._load_pool.submit(fn)
+        self._pending_loads.add(future)
+        future.add_done_callback(self._pending_loads.discard)
+        return asyncio.wrap_future(future)
+    
+    def ensure_preloading_started(self, languages: Optional[List[str]] = None):
+        """Ensure background preloading has started (safe to call from sync context)
+        
+        Args:
+            languages: Languages to preload (defaults to ModelConfig.preload_languages)
+        """
         if not self._preload_started:
             with self._preload_lock:
                 if not self._preload_started:
@@ -54,7 +92,7 @@ class OptimizedModelManager:
                         # Try to start preloading if we have an event loop
                         try:
                             loop = asyncio.get_running_loop()
-                            loop.create_task(self._background_preload())
+                            loop.create_task(self._background_preload(languages))
                             logger.info("Background preloading started")
                         except RuntimeError:
                             # No event loop running - that's okay, we'll preload on demand
@@ -62,24 +100,24 @@ class OptimizedModelManager:
                     except Exception as e:
                         logger.warning(f"Could not start background preloading: {e}")
 
-    async def _background_preload(self):
-        """Preload common models in background"""
-        logger.info("Starting background model preloading...")
+    async def _background_preload(self, languages: Optional[List[str]] = None):
+        """Preload the default model of each configured language in background
+        
+        Other languages are loaded on demand by get_model on first use.
+        """
+        if languages is None:
+            languages = DEFAULT_PRELOAD_LANGUAGES
+        logger.info(f"Starting background model preloading for: {', '.join(languages) or 'none'}")
         
-        # Common configurations to preload
+        # Configs are only built for preloaded languages, constructing one validates its model files
         preload_configs = [
-            # Vietnamese models
             {
-                "language": "vietnamese",
-                "config_name": "vietnamese_default",
-                "config": ModelConfig(language="vietnamese")
-            },
-            # English model  
-            {
-                "language": "english",
-                "config_name": "english_default", 
-                "config": ModelConfig(language="english")
+                "language": language,
+                "config_name": f"{language}_default",
+                "config": ModelConfig(language=language)
             }
+            for language in ("vietnamese", "english")
+            if language in languages
         ]
         
         tasks = []
@@ -104,19 +142,22 @@ class OptimizedModelManager:
             
             if language == "english":
                 # Preload English engine
+                from ..core.english_tts_engine import EnglishTTSEngine
                 engine = EnglishTTSEngine()
-                await asyncio.get_event_loop().run_in_executor(None, engine._load_model)
+                await self._submit_load(engine._load_model)
                 
                 with self._preload_lock:
-                    self._english_engines[config_name] = engine
+                    self._english_engines = {**self._english_engines, config_name: engine}
                     
             else:
                 # Preload Vietnamese model
+                from ..core.model import ModelSessionManager
                 model_manager = ModelSessionManager(config)
-                await asyncio.get_event_loop().run_in_executor(None, model_manager.load_models)
+                await self._submit_load(functools.partial(model_manager.load_models, warmup=True))
                 
                 with self._preload_lock:
-                    self._models[config_name] = model_manager
+                    self._pinned_keys.add(config_name)
+                    self._models = {**self._models, config_name: model_manager}
             
             load_time = time.time() - start_time
             logger.info(f"Successfully preloaded {config_name} in {load_time:.2f}s")
@@ -124,53 +165,136 @@ class OptimizedModelManager:
         except Exception as e:
             logger.error(f"Failed to preload {config_name}: {e}")
     
-    def get_model(self, config: ModelConfig) -> ModelSessionManager:
-        """Get model with optimized lookup"""
+    def get_model(self, config: ModelConfig) -> "ModelSessionManager":
+        """Get model with optimized lookup
+        
+        The model may be cleaned up once evicted; hold it through lease() while synthesizing.
+        """
         # Ensure preloading has started
-        self.ensure_preloading_started()
+        self.ensure_preloading_started(config.preload_languages)
         
         config_key = self._generate_config_key(config)
         
-        # First check preloaded models
-        with self._preload_lock:
-            if config.language == "english":
-                if "english_default" in self._english_engines:
-                    # For English, we need to wrap the engine in a compatible interface
-                    return self._get_english_model_wrapper(self._english_engines["english_default"])
-            else:
-                if "vietnamese_default" in self._models:
-                    return self._models["vietnamese_default"]
-            
-            # Check if we have exact match in cache
-            if config_key in self._models:
-                return self._models[config_key]
+        # First check preloaded models (lock-free reads of the current snapshots)
+        models = self._models
+        if config.language == "english":
+            engine = self._english_engines.get("english_default")
+            if engine is not None:
+                # For English, we need to wrap the engine in a compatible interface
+                return self._get_english_model_wrapper(engine)
+        else:
+            model_manager = models.get("vietnamese_default")
+            if model_manager is not None:
+                return model_manager
+        
+        # Check if we have exact match in cache
+        model_manager = models.get(config_key)
+        if model_manager is not None:
+            self._last_access[config_key] = next(self._access_clock)
+            return model_manager
         
         # If not preloaded, create on demand
         logger.info(f"Creating model on demand for: {config_key}")
         start_time = time.time()
         
+        from ..core.model import ModelSessionManager
         model_manager = ModelSessionManager(config)
-        model_manager.load_models()
+        model_manager.load_models(warmup=True)
         
-        with self._preload_lock:
-            self._models[config_key] = model_manager
+        self._put(config_key, model_manager, config.max_concurrent_requests)
         
         load_time = time.time() - start_time
         logger.info(f"Model created on demand in {load_time:.2f}s")
         
         return model_manager
     
+    def _put(self, config_key: str, model_manager: "ModelSessionManager", capacity: int):
+        """Insert an on-demand model, evicting least recently used ones beyond capacity"""
+        evicted = []
+        with self._preload_lock:
+            self._capacity = max(1, capacity)
+            self._last_access[config_key] = next(self._access_clock)
+            replaced = self._models.get(config_key)
+            if replaced is not None and replaced is not model_manager:
+                # A concurrent on-demand load of the same key got there first
+                evicted.append((config_key, replaced))
+            models = {**self._models, config_key: model_manager}
+            
+            while len(models) > self._capacity:
+                candidates = [key for key in models if key not in self._pinned_keys and key != config_key]
+                if not candidates:
+                    break
+                lru_key = min(candidates, key=lambda key: self._last_access.get(key, -1))
+                evicted.append((lru_key, models.pop(lru_key)))
+                self._last_access.pop(lru_key, None)
+            
+            self._models = models
+            
+            # Leased managers are torn down by the last release() instead
+            disposable = self._retire(manager for _, manager in evicted)
+        
+        for key, _ in evicted:
+            logger.info(f"Evicting least recently used model: {key}")
+        self._dispose(disposable)
+    
+    @contextmanager
+    def lease(self, config: ModelConfig) -> Iterator["ModelSessionManager"]:
+        """Get a model and keep it from being cleaned up until the block exits"""
+        from ..core.model import ModelSessionManager
+        
+        while True:
+            model_manager = self.get_model(config)
+            if not isinstance(model_manager, ModelSessionManager):
+                # English engine wrapper, nothing to tear down
+                yield model_manager
+                return
+            with self._preload_lock:
+                # A manager evicted with no users since the lookup may already be cleaned up
+                if model_manager in self._retired or model_manager in self._models.values():
+                    self._leases[model_manager] = self._leases.get(model_manager, 0) + 1
+                    break
+        
+        try:
+            yield model_manager
+        finally:
+            self._release(model_manager)
+    
+    def _release(self, model_manager: "ModelSessionManager"):
+        """Drop a lease, cleaning up a retired manager once its last user is done"""
+        with self._preload_lock:
+            users = self._leases.pop(model_manager) - 1
+            if users > 0:
+                self._leases[model_manager] = users
+                return
+            if model_manager not in self._retired:
+                return
+            self._retired.discard(model_manager)
+        self._dispose([model_manager])
+    
+    def _retire(self, managers) -> List["ModelSessionManager"]:
+        """Retire managers dropped from the cache, returning those with no users (lock held)"""
+        disposable = []
+        for model_manager in managers:
+            if model_manager in self._leases:
+                self._retired.add(model_manager)
+            else:
+                disposable.append(model_manager)
+        return disposable
+    
+    @staticmethod
+    def _dispose(managers: List["ModelSessionManager"]):
+        """Clean up managers no longer reachable from the cache or any lease"""
+        for model_manager in managers:
+            try:
+                model_manager.cleanup()
+            except Exception as e:
+                logger.warning(f"Failed to clean up model: {e}")
+    
     def _generate_config_key(self, config: ModelConfig) -> str:
         """Generate cache key for configuration"""
-        key_parts = [
-            config.language,
-            str(config.use_gpu),
-            str(config.gpu_id) if config.gpu_id is not None else "auto",
-            config.model_path or "default"
-        ]
-        return "|".join(key_parts)
+        return config.cache_key
     
-    def _get_english_model_wrapper(self, engine: EnglishTTSEngine) -> ModelSessionManager:
+    def _get_english_model_wrapper(self, engine: "EnglishTTSEngine") -> "ModelSessionManager":
         """Create a wrapper to make English engine compatible with ModelSessionManager interface"""
         # This is a simplified approach - in production you might want to create a proper adapter
         class EnglishModelWrapper:
@@ -196,6 +320,7 @@ class OptimizedModelManager:
         with self._preload_lock:
             return {
                 "preloaded_models": len(self._models),
+                "model_capacity": self._capacity,
                 "preloaded_english_engines": len(self._english_engines),
                 "warm_up_complete": self._warm_up_complete,
                 "total_cached_models": len(self._models) + len(self._english_engines)
@@ -205,104 +330,109 @@ class OptimizedModelManager:
         """Clear all cached models"""
         with self._preload_lock:
             # Cleanup models
-            for model in self._models.values():
-                try:
-                    model.cleanup()
-                except:
-                    pass
-            self._models.clear()
+            models, self._models = self._models, {}
+            self._last_access = {}
+            self._pinned_keys = set()
+            disposable = self._retire(models.values())
             
             # Clear English engines
-            self._english_engines.clear()
+            self._english_engines = {}
             
-            self._warm_up_complete = False
+            # Cancel queued loads without blocking on the running ones; later loads get a fresh
+            # pool. Python 3.8 has no shutdown(cancel_futures=True), so cancel them one by one
+            load_pool, self._load_pool = self._load_pool, self._new_load_pool()
+            for future in list(self._pending_loads):
+                future.cancel()
+            load_pool.shutdown(wait=False)
             
+            self._warm_up_complete = False
+        
+        self._dispose(disposable)
         logger.info("Model cache cleared")
 
 
-# Global instance
-_optimized_manager = None
-_manager_lock = threading.Lock()
+# Global instance, created at import so lookups never take a lock
+_optimized_manager = OptimizedModelManager()
 
 def get_optimized_manager() -> OptimizedModelManager:
     """Get the optimized model manager instance"""
-    global _optimized_manager
-    with _manager_lock:
-        if _optimized_manager is None:
-            _optimized_manager = OptimizedModelManager()
-        return _optimized_manager
+    return _optimized_manager
 
 
 class RequestBatcher:
     """Batch similar requests for optimal processing"""
     
-    def __init__(self, batch_size: int = 3, batch_timeout: float = 0.1):
+    def __init__(self, batch_size: int = 3, batch_timeout: float = 0.1, max_concurrent: int = 10):
         self.batch_size = batch_size
         self.batch_timeout = batch_timeout
-        self._pending_requests = []
+        self.max_concurrent = max_concurrent
+        # Created on first flush so it binds to the running event loop, not the import-time one
+        self._sem: Optional[asyncio.Semaphore] = None
+        # Pending requests grouped by config key at insertion: key -> [(data, callback, timestamp)]
+        self._pending_buckets: Dict[str, List[Tuple[Dict[str, Any], callable, float]]] = defaultdict(list)
+        self._pending_count = 0
+        self._oldest_timestamp = 0.0
         self._batch_lock = threading.RLock()
         
     async def add_request(self, request_data: Dict[str, Any], callback: callable):
         """Add request to batch processing queue"""
         with self._batch_lock:
-            self._pending_requests.append({
-                "data": request_data,
-                "callback": callback,
-                "timestamp": time.time()
-            })
+            timestamp = time.monotonic()
+            if not self._pending_count:
+                self._oldest_timestamp = timestamp
+            config_key = self._get_config_key(request_data)
+            self._pending_buckets[config_key].append((request_data, callback, timestamp))
+            self._pending_count += 1
             
             # Process batch if it's full or timeout reached
-            if (len(self._pending_requests) >= self.batch_size or 
+            if (self._pending_count >= self.batch_size or 
                 self._should_process_batch()):
                 await self._process_batch()
     
     def _should_process_batch(self) -> bool:
         """Check if batch should be processed based on timeout"""
-        if not self._pending_requests:
+        if not self._pending_count:
             return False
         
-        oldest_request = min(req["timestamp"] for req in self._pending_requests)
-        return (time.time() - oldest_request) >= self.batch_timeout
+        return (time.monotonic() - self._oldest_timestamp) >= self.batch_timeout
     
     async def _process_batch(self):
         """Process pending requests in batch"""
-        if not self._pending_requests:
+        if not self._pending_count:
             return
         
-        current_batch = self._pending_requests.copy()
-        self._pending_requests.clear()
+        buckets = self._pending_buckets
+        self._pending_buckets = defaultdict(list)
+        self._pending_count = 0
         
-        # Group by similar configurations
-        batches_by_config = {}
-        for request in current_batch:
-            config_key = self._get_config_key(request["data"])
-            if config_key not in batches_by_config:
-                batches_by_config[config_key] = []
-            batches_by_config[config_key].append(request)
+        if self._sem is None:
+            self._sem = asyncio.Semaphore(self.max_concurrent)
         
-        # Process each group
-        tasks = []
-        for config_key, batch in batches_by_config.items():
-            task = asyncio.create_task(self._process_config_batch(batch))
-            tasks.append(task)
-        
-        await asyncio.gather(*tasks, return_exceptions=True)
+        # Process each group; at most max_concurrent groups run at once and
+        # results are dropped as they complete instead of being collected
+        tasks = [asyncio.create_task(self._process_config_batch(batch)) for batch in buckets.values()]
+        for completed in asyncio.as_completed(tasks):
+            try:
+                await completed
+            except Exception as e:
+                logger.warning(f"Batch processing failed: {e}")
     
     def _get_config_key(self, request_data: Dict[str, Any]) -> str:
         """Generate key for request configuration"""
         return f"{request_data.get('language', 'vietnamese')}_{request_data.get('voice_id', 'default')}"
     
-    async def _process_config_batch(self, batch: List[Dict[str, Any]]):
+    async def _process_config_batch(self, batch: List[Tuple[Dict[str, Any], callable, float]]):
         """Process a batch of requests with same configuration"""
-        # This is where you could implement actual batching logic
-        # For now, process individually but with shared model instance
-        for request in batch:
-            try:
-                # Process individual request
-                result = await self._process_single_request(request["data"])
-                request["callback"]({"success": True, "result": result})
-            except Exception as e:
-                request["callback"]({"success": False, "error": str(e)})
+        async with self._sem:
+            # This is where you could implement actual batching logic
+            # For now, process individually but with shared model instance
+            for request_data, callback, _ in batch:
+                try:
+                    # Process individual request
+                    result = await self._process_single_request(request_data)
+                    callback({"success": True, "result": result})
+                except Exception as e:
+                    callback({"success": False, "error": str(e)})
     
     async def _process_single_request(self, request_data: Dict[str, Any]):
         """Process a single request (placeholder)"""
@@ -314,75 +444,54 @@ class RequestBatcher:
 class PerformanceMonitor:
     """Monitor and log performance metrics"""
     
-    def __init__(self):
-        self._metrics = {
-            "total_requests": 0,
-            "cache_hits": 0,
-            "cache_misses": 0,
-            "average_response_time": 0,
-            "total_processing_time": 0
-        }
-        self._metrics_lock = threading.RLock()
-    
-    def record_request(self, processing_time: float, cache_hit: bool):
-        """Record request metrics"""
-        with self._metrics_lock:
-            self._metrics["total_requests"] += 1
-            self._metrics["total_processing_time"] += processing_time
-            
-            if cache_hit:
-                self._metrics["cache_hits"] += 1
-            else:
-                self._metrics["cache_misses"] += 1
-            
-            # Update average
-            self._metrics["average_response_time"] = (
-                self._metrics["total_processing_time"] / self._metrics["total_requests"]
-            )
-    
-    def get_metrics(self) -> Dict[str, Any]:
-        """Get current performance metrics"""
-        with self._metrics_lock:
-            total_requests = self._metrics["total_requests"]
-            if total_requests > 0:
-                cache_hit_rate = (self._metrics["cache_hits"] / total_requests) * 100
-            else:
-                cache_hit_rate = 0
-            
-            return {
-                **self._metrics,
-                "cache_hit_rate": cache_hit_rate
-            }
-
-
-class SimplePerformanceMonitor:
-    """Simple performance monitor without async dependencies"""
+    # Slotted counters: record_request runs on every request, skip the instance __dict__
+    __slots__ = ("_total_requests", "_total_time", "_cache_hits", "_cache_misses")
     
     def __init__(self):
-        self._requests = 0
-        self._total_time = 0
+        # Plain counters; averages are derived on read
+        self._total_requests = 0
+        self._total_time = 0.0
         self._cache_hits = 0
+        self._cache_misses = 0
     
-    def record_request(self, duration: float, cache_hit: bool = False):
-        """Record a request"""
-        self._requests += 1
-        self._total_time += duration
+    def record_request(self, processing_time: float, cache_hit: bool = False):
+        """Record request metrics"""
+        self._total_requests += 1
+        self._total_time += processing_time
+        
         if cache_hit:
             self._cache_hits += 1
+        else:
+            self._cache_misses += 1
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get performance metrics"""
-        avg_time = self._total_time / max(self._requests, 1)
-        cache_hit_rate = (self._cache_hits / max(self._requests, 1)) * 100
+        """Get current performance metrics"""
+        total_requests = self._total_requests
+        total_time = self._total_time
+        cache_hits = self._cache_hits
+        
+        if total_requests > 0:
+            average_response_time = total_time / total_requests
+            cache_hit_rate = (cache_hits / total_requests) * 100
+        else:
+            average_response_time = 0
+            cache_hit_rate = 0
         
         return {
-            "total_requests": self._requests,
-            "average_response_time": avg_time,
-            "cache_hit_rate": cache_hit_rate,
-            "total_time": self._total_time
+            "total_requests": total_requests,
+            "cache_hits": cache_hits,
+            "cache_misses": self._cache_misses,
+            "average_response_time": average_response_time,
+            "total_processing_time": total_time,
+            "total_time": total_time,
+            "cache_hit_rate": cache_hit_rate
         }
 
 
+# Kept for callers of the former standalone implementation
+SimplePerformanceMonitor = PerformanceMonitor
+
+
 # Global instances
 _request_batcher = RequestBatcher()
 _performance_monitor = PerformanceMonitor()
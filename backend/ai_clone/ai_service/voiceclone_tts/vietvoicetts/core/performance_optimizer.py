@@ -2,10 +2,11 @@
 Performance optimization utilities for long text TTS processing
 """
 
+import os
 import time
-import psutil
-import numpy as np
-from typing import Dict, Any, Optional, Tuple
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -31,121 +32,228 @@ class ProcessingStats:
     cpu_usage: float
 
 
+# Number of recent chunk records kept for baseline learning
+HISTORY_SIZE = 100
+# Number of most recent records averaged into the baseline
+BASELINE_WINDOW = 20
+
+# Prosody punctuation bytes. All of them are ASCII, and UTF-8 multi-byte sequences only use
+# bytes >= 0x80, so they can be counted in the UTF-8 encoding directly
+_PUNCT_BYTES = b'.!?,:;'
+
+# Texts whose complexity scores are memoized
+METRICS_CACHE_SIZE = 32
+
+# System memory is re-read at most this often; CPU count is fixed for the process
+SYS_STATS_TTL = 0.2
+# System-wide CPU utilization is re-sampled at most this often
+CPU_PERCENT_TTL = 0.25
+_CPU_COUNT = os.cpu_count() or 1
+
+
+@dataclass
+class _SysCache:
+    """Last sampled system stats"""
+    ts: float = float('-inf')
+    avail_mb: float = 0.0
+    cpu_count: int = _CPU_COUNT
+    cpu_ts: float = float('-inf')
+    cpu_percent: float = 0.0
+
+
+_sys_cache = _SysCache()
+
+
+def _get_sys() -> _SysCache:
+    """System stats, refreshed from psutil when older than SYS_STATS_TTL"""
+    now = time.monotonic()
+    if now - _sys_cache.ts >= SYS_STATS_TTL:
+        import psutil  # Deferred with the first refresh, importing this module stays cheap
+        _sys_cache.avail_mb = psutil.virtual_memory().available / (1024 * 1024)  # MB
+        _sys_cache.ts = now
+    return _sys_cache
+
+
+def _cpu_percent_cached() -> float:
+    """
+    System-wide CPU utilization, sampled at most every CPU_PERCENT_TTL.
+    
+    This is psutil's non-blocking reading (utilization since the previous sample),
+    not an instantaneous value; polls within the TTL share the last sample.
+    """
+    now = time.monotonic()
+    if now - _sys_cache.cpu_ts >= CPU_PERCENT_TTL:
+        import psutil
+        _sys_cache.cpu_percent = psutil.cpu_percent()
+        _sys_cache.cpu_ts = now
+    return _sys_cache.cpu_percent
+
+
+# Fixed costs of the processing estimates
+IO_OVERHEAD = 2.0          # Base I/O time (s)
+CHUNK_IO_OVERHEAD = 0.5    # Per chunk I/O time (s)
+MODEL_MEMORY_MB = 500.0    # MB for ONNX model
+CHUNK_MEMORY_MB = 50.0     # MB per chunk buffer
+
+
+def _estimate_time(text_length: float, use_chunking: bool, chunk_count: int,
+                   cps: float, ovh: float, cho: float) -> float:
+    """Processing time estimate (s) from plain baseline values"""
+    if use_chunking:
+        return text_length / cps * ovh + chunk_count * (cho + CHUNK_IO_OVERHEAD) + IO_OVERHEAD
+    return text_length / cps * ovh + IO_OVERHEAD
+
+
+def _estimate_mem(text_length: float, chunk_count: int, mpc: float) -> float:
+    """Memory estimate (MB) from plain baseline values"""
+    return text_length * mpc + MODEL_MEMORY_MB + chunk_count * CHUNK_MEMORY_MB
+
+
+# Chunk sizing tunables
+CHUNK_TARGET_TIME = 30.0       # Target processing time per chunk (s)
+CHUNK_MEMORY_FRACTION = 0.3    # Share of available memory a chunk may use
+MIN_CHUNK_SIZE = 300
+MAX_CHUNK_SIZE = 1200
+
+
+def _make_chunk_sizer(target_chunk_time: float, cps: float, mpc: float,
+                      mem_frac: float = CHUNK_MEMORY_FRACTION,
+                      lo: int = MIN_CHUNK_SIZE, hi: int = MAX_CHUNK_SIZE) -> Callable[[float], int]:
+    """
+    Specialize the chunk size formula for fixed tunables and baseline.
+
+    The time bound and upper clamp do not depend on available memory, so they are
+    folded into one constant; the returned function only handles the memory bound.
+    """
+    time_bound = min(int(target_chunk_time * cps), hi)
+
+    def chunk_size(avail_mb: float) -> int:
+        return max(lo, min(time_bound, int(avail_mb / mpc * mem_frac)))
+
+    return chunk_size
+
+
 class PerformanceOptimizer:
     """Performance optimizer for TTS processing"""
     
     def __init__(self):
-        self.processing_history = []
-        self.baseline_metrics = self._establish_baseline()
-        
-    def _establish_baseline(self) -> Dict[str, float]:
-        """Establish baseline performance metrics"""
+        # Recent chunk records as a struct-of-arrays ring buffer
+        self._hist_chunk_size = array('d', bytes(8 * HISTORY_SIZE))
+        self._hist_proc_time = array('d', bytes(8 * HISTORY_SIZE))
+        self._hist_cps = array('d', bytes(8 * HISTORY_SIZE))
+        self._hist_ts = array('d', bytes(8 * HISTORY_SIZE))
+        self._hist_idx = 0  # Next write position
+        self._hist_count = 0  # Records written in total
+        # Complexity scores memoized by text; the rest of a plan depends on the baseline and on
+        # current free memory, so it is recomputed (cheap arithmetic) on every call
+        self._complexity_cache: "OrderedDict[str, float]" = OrderedDict()
+        self._chunk_sizer: Optional[Callable[[float], int]] = None  # Built for CHUNK_TARGET_TIME on demand
+        self._establish_baseline()
+        
+    def _establish_baseline(self):
+        """Establish baseline performance metrics (plain attributes, read on every estimate)"""
+        self._cps = 50.0   # Characters processed per second
+        self._mpc = 0.1    # MB per character
+        self._ovh = 1.3    # Processing overhead
+        self._cho = 0.05   # Overhead per chunk
+    
+    @property
+    def baseline_metrics(self) -> Dict[str, float]:
+        """Snapshot of the baseline performance metrics"""
         return {
-            'chars_per_second': 50.0,  # Characters processed per second
-            'memory_per_char': 0.1,    # MB per character
-            'overhead_factor': 1.3,    # Processing overhead
-            'chunking_overhead': 0.05   # Overhead per chunk
+            'chars_per_second': self._cps,
+            'memory_per_char': self._mpc,
+            'overhead_factor': self._ovh,
+            'chunking_overhead': self._cho
         }
     
     def estimate_processing_time(self, text_length: int, 
                                use_chunking: bool = False,
                                chunk_count: int = 1) -> float:
         """Estimate total processing time for text"""
-        base_time = text_length / self.baseline_metrics['chars_per_second']
-        
-        # Apply overhead
-        base_time *= self.baseline_metrics['overhead_factor']
-        
-        # Add chunking overhead
-        if use_chunking:
-            chunking_overhead = chunk_count * self.baseline_metrics['chunking_overhead']
-            base_time += chunking_overhead
-        
-        # Add I/O overhead for file operations
-        io_overhead = 2.0  # Base I/O time
-        if use_chunking:
-            io_overhead += chunk_count * 0.5  # Per chunk I/O
-        
-        return base_time + io_overhead
+        return _estimate_time(text_length, use_chunking, chunk_count, self._cps, self._ovh, self._cho)
     
     def estimate_memory_usage(self, text_length: int, 
                             chunk_count: int = 1) -> float:
         """Estimate memory usage in MB"""
-        base_memory = text_length * self.baseline_metrics['memory_per_char']
-        
-        # Add model memory (estimated)
-        model_memory = 500.0  # MB for ONNX model
-        
-        # Add chunk processing memory
-        chunk_memory = chunk_count * 50.0  # MB per chunk buffer
-        
-        return base_memory + model_memory + chunk_memory
+        return _estimate_mem(text_length, chunk_count, self._mpc)
     
     def should_use_chunking(self, text: str, 
                           max_memory_mb: float = 2048,
                           max_processing_time: float = 300) -> Tuple[bool, str]:
         """Determine if chunking should be used"""
-        text_length = len(text)
+        reason = self._chunking_constraint(len(text), max_memory_mb, max_processing_time)
+        if reason is not None:
+            return True, reason
+        return False, "No chunking needed"
+    
+    def _chunking_constraint(self, text_length: int,
+                             max_memory_mb: float = 2048,
+                             max_processing_time: float = 300) -> Optional[str]:
+        """Reason chunking is required for a text of this length, None if it is not"""
+        # Cheapest check first: text length constraints (ONNX model limits)
+        if text_length > 2000:
+            return f"Text length constraint: {text_length} chars > 2000 chars"
         
-        # Check memory constraints
-        estimated_memory = self.estimate_memory_usage(text_length, 1)
+        # Check memory constraints (single chunk)
+        estimated_memory = text_length * self._mpc + MODEL_MEMORY_MB + CHUNK_MEMORY_MB
         if estimated_memory > max_memory_mb:
-            return True, f"Memory constraint: {estimated_memory:.1f}MB > {max_memory_mb}MB"
+            return f"Memory constraint: {estimated_memory:.1f}MB > {max_memory_mb}MB"
         
-        # Check processing time constraints
-        estimated_time = self.estimate_processing_time(text_length, False)
+        # Check processing time constraints (no chunking)
+        estimated_time = text_length / self._cps * self._ovh + IO_OVERHEAD
         if estimated_time > max_processing_time:
-            return True, f"Time constraint: {estimated_time:.1f}s > {max_processing_time}s"
+            return f"Time constraint: {estimated_time:.1f}s > {max_processing_time}s"
         
-        # Check text length constraints (ONNX model limits)
-        if text_length > 2000:
-            return True, f"Text length constraint: {text_length} chars > 2000 chars"
-        
-        return False, "No chunking needed"
+        return None
     
     def optimize_chunk_size(self, text: str, 
-                          target_chunk_time: float = 30.0) -> int:
+                          target_chunk_time: float = CHUNK_TARGET_TIME) -> int:
         """Calculate optimal chunk size based on performance constraints"""
-        text_length = len(text)
-        
-        # Calculate chunk size for target processing time
-        target_chars_per_chunk = int(target_chunk_time * self.baseline_metrics['chars_per_second'])
-        
-        # Adjust based on system capabilities
-        available_memory = psutil.virtual_memory().available / (1024 * 1024)  # MB
-        memory_based_chunk_size = int(available_memory / self.baseline_metrics['memory_per_char'] * 0.3)
-        
-        # Take the minimum to ensure we don't exceed constraints
-        optimal_chunk_size = min(target_chars_per_chunk, memory_based_chunk_size)
-        
-        # Ensure reasonable bounds
-        optimal_chunk_size = max(300, min(optimal_chunk_size, 1200))
-        
-        return optimal_chunk_size
+        if target_chunk_time == CHUNK_TARGET_TIME:
+            chunk_sizer = self._default_chunk_sizer()
+        else:
+            chunk_sizer = _make_chunk_sizer(target_chunk_time, self._cps, self._mpc)
+        return chunk_sizer(_get_sys().avail_mb)
+    
+    def _default_chunk_sizer(self) -> Callable[[float], int]:
+        """Chunk sizer for CHUNK_TARGET_TIME, rebuilt after the baseline changes"""
+        chunk_sizer = self._chunk_sizer
+        if chunk_sizer is None:
+            chunk_sizer = self._chunk_sizer = _make_chunk_sizer(CHUNK_TARGET_TIME, self._cps, self._mpc)
+        return chunk_sizer
     
     def calculate_performance_metrics(self, text: str) -> PerformanceMetrics:
         """Calculate comprehensive performance metrics"""
         text_length = len(text)
+        sys_stats = _get_sys()  # One system snapshot for the whole plan
         
         # Determine if chunking is needed
-        use_chunking, reason = self.should_use_chunking(text)
+        use_chunking = self._chunking_constraint(text_length) is not None
         
         if use_chunking:
-            optimal_chunk_size = self.optimize_chunk_size(text)
-            chunk_count = max(1, (text_length + optimal_chunk_size - 1) // optimal_chunk_size)
+            optimal_chunk_size = self._default_chunk_sizer()(sys_stats.avail_mb)
         else:
-            chunk_count = 1
-            optimal_chunk_size = text_length
+            optimal_chunk_size = text_length or 1
+        # Ceiling division; the single-chunk case yields 1 (empty text counts as one chunk)
+        chunk_count = -(-text_length // optimal_chunk_size) or 1
         
         # Calculate metrics
-        estimated_time = self.estimate_processing_time(text_length, use_chunking, chunk_count)
-        memory_requirement = self.estimate_memory_usage(text_length, chunk_count)
-        
-        # Calculate processing complexity
-        complexity = self._calculate_processing_complexity(text)
+        estimated_time = _estimate_time(text_length, use_chunking, chunk_count, self._cps, self._ovh, self._cho)
+        memory_requirement = _estimate_mem(text_length, chunk_count, self._mpc)
+        
+        # Calculate processing complexity (the only full scan of the text, so it is memoized)
+        complexity = self._complexity_cache.get(text)
+        if complexity is None:
+            complexity = self._calculate_processing_complexity(text)
+            self._complexity_cache[text] = complexity
+            if len(self._complexity_cache) > METRICS_CACHE_SIZE:
+                self._complexity_cache.popitem(last=False)
+        else:
+            self._complexity_cache.move_to_end(text)
         
         # Determine recommended batch size
-        batch_size = self._calculate_batch_size(chunk_count, memory_requirement)
+        batch_size = self._calculate_batch_size(chunk_count, memory_requirement, sys_stats)
         
         return PerformanceMetrics(
             estimated_processing_time=estimated_time,
@@ -163,21 +271,25 @@ class PerformanceOptimizer:
         length_factor = min(len(text) / 5000, 1.0)
         factors.append(length_factor)
         
-        # Vietnamese character density
-        vietnamese_chars = len([c for c in text if ord(c) > 127])
+        # Vietnamese character density (the ASCII encoder drops exactly the non-ASCII characters)
+        vietnamese_chars = len(text) - len(text.encode('ascii', errors='ignore'))
         viet_factor = min(vietnamese_chars / len(text) * 2, 1.0) if text else 0
         factors.append(viet_factor)
         
         # Punctuation density (affects prosody processing)
-        punct_count = len([c for c in text if c in '.!?,:;'])
+        utf8 = text.encode('utf-8', errors='surrogatepass')
+        punct_count = sum(map(utf8.count, _PUNCT_BYTES))
         punct_factor = min(punct_count / len(text) * 50, 1.0) if text else 0
         factors.append(punct_factor)
         
-        return np.mean(factors) if factors else 0.5
+        return sum(factors) / len(factors) if factors else 0.5
     
-    def _calculate_batch_size(self, chunk_count: int, memory_requirement: float) -> int:
+    def _calculate_batch_size(self, chunk_count: int, memory_requirement: float,
+                              sys_stats: Optional[_SysCache] = None) -> int:
         """Calculate optimal batch size for chunk processing"""
-        available_memory = psutil.virtual_memory().available / (1024 * 1024)  # MB
+        if sys_stats is None:
+            sys_stats = _get_sys()
+        available_memory = sys_stats.avail_mb
         
         # Conservative memory usage (use 50% of available)
         usable_memory = available_memory * 0.5
@@ -191,7 +303,7 @@ class PerformanceOptimizer:
         batch_size = max(1, min(max_concurrent_chunks, chunk_count))
         
         # Don't exceed system CPU count for parallel processing
-        cpu_count = psutil.cpu_count()
+        cpu_count = sys_stats.cpu_count
         batch_size = min(batch_size, cpu_count)
         
         return batch_size
@@ -204,36 +316,51 @@ class PerformanceOptimizer:
         """Record processing time for future optimization"""
         chars_per_second = chunk_size / processing_time if processing_time > 0 else 0
         
-        self.processing_history.append({
-            'chunk_size': chunk_size,
-            'processing_time': processing_time,
-            'chars_per_second': chars_per_second,
-            'timestamp': time.time()
-        })
-        
-        # Keep only recent history (last 100 records)
-        if len(self.processing_history) > 100:
-            self.processing_history = self.processing_history[-100:]
+        idx = self._hist_idx
+        self._hist_chunk_size[idx] = chunk_size
+        self._hist_proc_time[idx] = processing_time
+        self._hist_cps[idx] = chars_per_second
+        self._hist_ts[idx] = time.time()
+        self._hist_idx = (idx + 1) % HISTORY_SIZE
+        self._hist_count += 1
         
         # Update baseline metrics based on recent performance
         self._update_baseline_metrics()
     
+    @property
+    def processing_history(self) -> List[Dict[str, float]]:
+        """Recent chunk records, oldest first"""
+        count = min(self._hist_count, HISTORY_SIZE)
+        order = [(self._hist_idx - count + i) % HISTORY_SIZE for i in range(count)]
+        return [
+            {
+                'chunk_size': int(self._hist_chunk_size[i]),
+                'processing_time': self._hist_proc_time[i],
+                'chars_per_second': self._hist_cps[i],
+                'timestamp': self._hist_ts[i]
+            }
+            for i in order
+        ]
+    
     def _update_baseline_metrics(self):
         """Update baseline metrics based on recent performance data"""
-        if len(self.processing_history) < 5:
+        if self._hist_count < 5:
             return
         
-        recent_history = self.processing_history[-20:]  # Last 20 records
-        
-        # Calculate average chars per second
-        avg_chars_per_second = np.mean([h['chars_per_second'] for h in recent_history])
+        # Calculate average chars per second over the most recent records
+        recent_count = min(self._hist_count, BASELINE_WINDOW)
+        end = self._hist_idx
+        start = end - recent_count
+        if start >= 0:
+            total_chars_per_second = sum(self._hist_cps[start:end])
+        else:
+            total_chars_per_second = sum(self._hist_cps[start:]) + sum(self._hist_cps[:end])
+        avg_chars_per_second = total_chars_per_second / recent_count
         
         # Update baseline with exponential smoothing
         alpha = 0.1  # Smoothing factor
-        self.baseline_metrics['chars_per_second'] = (
-            alpha * avg_chars_per_second + 
-            (1 - alpha) * self.baseline_metrics['chars_per_second']
-        )
+        self._cps = alpha * avg_chars_per_second + (1 - alpha) * self._cps
+        self._chunk_sizer = None
 
 
 class ProcessingMonitor:
@@ -244,8 +371,11 @@ class ProcessingMonitor:
         self.optimizer = optimizer
         self.chunks_processed = 0
         self.start_time = time.time()
-        self.chunk_times = []
+        self.chunk_times = array('d')  # Contiguous doubles, no boxed floats
+        self._chunk_time_sum = 0.0  # Running total for an O(1) average
         self.current_chunk_start = None
+        import psutil
+        self._proc = psutil.Process()  # Reused handle, opened once per monitor
         
     def start_chunk(self):
         """Start timing a chunk"""
@@ -258,6 +388,7 @@ class ProcessingMonitor:
         
         chunk_time = time.time() - self.current_chunk_start
         self.chunk_times.append(chunk_time)
+        self._chunk_time_sum += chunk_time
         self.chunks_processed += 1
         
         # Record in optimizer for learning
@@ -271,15 +402,15 @@ class ProcessingMonitor:
         elapsed_time = current_time - self.start_time
         
         # Calculate average chunk time
-        avg_chunk_time = np.mean(self.chunk_times) if self.chunk_times else 0
+        avg_chunk_time = self._chunk_time_sum / len(self.chunk_times) if self.chunk_times else 0
         
         # Estimate remaining time
         remaining_chunks = self.total_chunks - self.chunks_processed
         estimated_remaining = remaining_chunks * avg_chunk_time if avg_chunk_time > 0 else 0
         
         # Get system stats
-        memory_usage = psutil.Process().memory_info().rss / (1024 * 1024)  # MB
-        cpu_usage = psutil.cpu_percent()
+        memory_usage = self._proc.memory_info().rss / (1024 * 1024)  # MB
+        cpu_usage = _cpu_percent_cached()
         
         # Current chunk time
         current_chunk_time = (current_time - self.current_chunk_start) if self.current_chunk_start else 0
@@ -0,0 +1,94 @@
+"""
+Build-time INT8 quantization of the model archive for the CPU execution path
+
+Adds dynamically quantized ``<model>.int8.onnx`` members next to the FP32
+graphs; ModelSessionManager prefers them when only the CPU provider is active.
+
+Usage:
+    python -m vietvoicetts.core.quantization model-bin.pt [--output model-bin.int8.pt]
+"""
+
+import argparse
+import shutil
+import tarfile
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# Models whose MatMul/Gemm weights dominate CPU time; preprocess is left in FP32
+QUANTIZED_MODELS = ("transformer", "decode")
+QUANTIZED_SUFFIX = ".int8.onnx"
+QUANTIZED_OP_TYPES = ["MatMul", "Gemm"]
+
+
+def quantized_name(model_name: str) -> str:
+    """Archive file name of the quantized graph for a model"""
+    return f"{model_name}{QUANTIZED_SUFFIX}"
+
+
+def quantize_archive(model_path: str, output_path: Optional[str] = None) -> str:
+    """
+    Write a copy of the model archive with INT8 variants of the quantizable models
+
+    Args:
+        model_path: Source model archive (tar)
+        output_path: Destination archive (defaults to replacing model_path)
+
+    Returns:
+        Path of the written archive
+    """
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    output_path = output_path or model_path
+
+    with tempfile.TemporaryDirectory(prefix="tts_quant_") as work_dir:
+        work_dir = Path(work_dir)
+        quantized = {}
+
+        with tarfile.open(model_path, 'r') as tar:
+            members = tar.getmembers()
+            for model_name in QUANTIZED_MODELS:
+                source = next((m for m in members if m.name.endswith(f"{model_name}.onnx")), None)
+                if source is None:
+                    raise FileNotFoundError(f"Model file '{model_name}.onnx' not found in model archive")
+
+                fp32_path = work_dir / f"{model_name}.onnx"
+                with open(fp32_path, 'wb') as f:
+                    shutil.copyfileobj(tar.extractfile(source), f)
+
+                int8_path = work_dir / quantized_name(model_name)
+                quantize_dynamic(
+                    model_input=str(fp32_path),
+                    model_output=str(int8_path),
+                    weight_type=QuantType.QInt8,
+                    op_types_to_quantize=QUANTIZED_OP_TYPES
+                )
+                quantized[str(Path(source.name).with_name(quantized_name(model_name)))] = int8_path
+
+            staged_path = work_dir / "archive.tar"
+            with tarfile.open(staged_path, 'w') as out:
+                for member in members:
+                    # Drop stale quantized graphs, they are rebuilt below
+                    if member.name in quantized:
+                        continue
+                    out.addfile(member, tar.extractfile(member) if member.isfile() else None)
+                for arcname, int8_path in quantized.items():
+                    out.add(str(int8_path), arcname=arcname)
+
+        shutil.move(str(staged_path), output_path)
+
+    return output_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Add INT8 quantized models to a VietVoice TTS model archive")
+    parser.add_argument("model_path", help="Model archive to quantize")
+    parser.add_argument("--output", help="Output archive (default: overwrite the input)")
+    args = parser.parse_args()
+
+    output_path = quantize_archive(args.model_path, args.output)
+    print(f"Quantized models written to: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
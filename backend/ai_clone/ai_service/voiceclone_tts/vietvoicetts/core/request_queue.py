@@ -3,15 +3,49 @@ Request Queue Manager for concurrent TTS processing with job tracking
 """
 
 import asyncio
+import bisect
+import functools
+import itertools
+import os
 import time
 import uuid
-from typing import Dict, List, Optional, Any, Callable, Union
-from dataclasses import dataclass, field
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Deque, Dict, List, Optional, Any, Callable, Tuple, Union
+from dataclasses import dataclass, field, fields
 from enum import Enum
 import logging
 import json
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Client IPs tracked by the rate limiter; least recently seen clients are dropped beyond this
+RATE_LIMIT_MAX_CLIENTS = 10_000
+
+# Queue item that tells one worker to exit; sorts ahead of every job
+_WORKER_STOP = (-999, 0, None)
+# Estimated job duration by text length: texts shorter than _DURATION_TIERS[i] characters
+# get _DURATION_VALUES[i] seconds, longer ones the last value
+_DURATION_TIERS = (500, 2000, 5000)
+_DURATION_VALUES = (15.0, 30.0, 60.0, 120.0)
+# Smallest progress change (in percent) forwarded from a synthesis thread within one stage
+PROGRESS_MIN_STEP = 1.0
+# Seconds stop() waits for busy workers to finish their current job before cancelling them
+SHUTDOWN_GRACE_PERIOD = 5.0
+
+
+def _encode_job(payload: Dict[str, Any]) -> bytes:
+    """Serialize a job status payload to JSON bytes, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload).encode("utf-8")
+
 
 class JobStatus(Enum):
     """Job status enumeration"""
@@ -23,6 +57,10 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# Statuses a job can still be cancelled from
+_CANCELLABLE = frozenset({JobStatus.PENDING, JobStatus.QUEUED})
+
+
 class JobPriority(Enum):
     """Job priority levels"""
     LOW = 1
@@ -31,14 +69,70 @@ class JobPriority(Enum):
     URGENT = 4
 
 
-@dataclass
 class JobProgress:
-    """Job progress information"""
-    stage: str = "initialized"
-    progress_percent: float = 0.0
-    message: str = ""
-    details: Dict[str, Any] = field(default_factory=dict)
-    estimated_remaining_time: Optional[float] = None
+    """Job progress information (slotted: it is rewritten on every progress callback)"""
+    __slots__ = ("stage", "progress_percent", "message", "details", "estimated_remaining_time")
+    
+    def __init__(self, stage: str = "initialized", progress_percent: float = 0.0, message: str = "",
+                 details: Optional[Dict[str, Any]] = None,
+                 estimated_remaining_time: Optional[float] = None):
+        self.stage = stage
+        self.progress_percent = progress_percent
+        self.message = message
+        self.details = details if details is not None else {}
+        self.estimated_remaining_time = estimated_remaining_time
+    
+    def __repr__(self) -> str:
+        return (f"JobProgress(stage={self.stage!r}, progress_percent={self.progress_percent!r}, "
+                f"message={self.message!r}, details={self.details!r}, "
+                f"estimated_remaining_time={self.estimated_remaining_time!r})")
+
+
+@dataclass
+class TTSRequest:
+    """Synthesis parameters of a job, parsed once at submission"""
+    text: str
+    speed: float = 1.0
+    random_seed: int = 9527
+    enable_chunking: bool = True
+    chunk_overlap: int = 50
+    
+    # Interactive voice
+    gender: str = "female"
+    group: str = "story"
+    area: str = "northern"
+    emotion: str = "neutral"
+    prosody_consistency: float = 1.0
+    
+    # Voice cloning
+    use_default_sample: bool = True
+    default_sample_id: Optional[str] = None
+    reference_text: Optional[str] = None
+    reference_audio_base64: Optional[str] = None
+    voice_consistency: float = 1.0
+    
+    text_length: int = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        self.text_length = len(self.text)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TTSRequest":
+        """Build from API request data; keys that are not synthesis parameters are ignored"""
+        if "text" not in data:
+            raise ValueError("Request data must include 'text'")
+        params = {name: data[name] for name in _TTS_REQUEST_PARAMS if name in data}
+        # API schemas name the interactive-voice area "area_or_accent"
+        if "area" not in params and data.get("area_or_accent") is not None:
+            params["area"] = data["area_or_accent"]
+        return cls(**params)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Synthesis parameters as a plain dict (inverse of from_dict)"""
+        return {name: getattr(self, name) for name in _TTS_REQUEST_PARAMS}
+
+
+_TTS_REQUEST_PARAMS = tuple(f.name for f in fields(TTSRequest) if f.init)
 
 
 @dataclass
@@ -57,7 +151,7 @@ class TTSJob:
     """TTS processing job"""
     job_id: str
     job_type: str  # "interactive_voice" | "voice_cloning"
-    request_data: Dict[str, Any]
+    request_data: TTSRequest
     status: JobStatus = JobStatus.PENDING
     priority: JobPriority = JobPriority.NORMAL
     
@@ -81,23 +175,48 @@ class TTSJob:
     client_ip: Optional[str] = None
     user_agent: Optional[str] = None
     
+    # API payload, frozen once the job reaches a final state
+    _cached_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_json: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    
     def update_progress(self, stage: str, progress: float, message: str = "", 
                        details: Optional[Dict[str, Any]] = None,
                        estimated_remaining: Optional[float] = None):
         """Update job progress"""
-        self.progress.stage = stage
-        self.progress.progress_percent = min(100.0, max(0.0, progress))
-        self.progress.message = message
+        current = self.progress
+        progress = min(100.0, max(0.0, progress))
+        # Callbacks often repeat the last update verbatim; nothing to write then
+        if (not details and estimated_remaining is None and current.stage == stage
+                and current.progress_percent == progress and current.message == message):
+            return
+        current.stage = stage
+        current.progress_percent = progress
+        current.message = message
         if details:
-            self.progress.details.update(details)
+            current.details.update(details)
         if estimated_remaining is not None:
-            self.progress.estimated_remaining_time = estimated_remaining
+            current.estimated_remaining_time = estimated_remaining
     
     def set_result(self, result: JobResult):
         """Set job result and mark as completed or failed"""
         self.result = result
         self.completed_at = time.time()
         self.status = JobStatus.COMPLETED if result.success else JobStatus.FAILED
+        self._cached_dict = self.to_dict()
+    
+    def get_status_dict(self) -> Dict[str, Any]:
+        """API payload; finished jobs return the dict frozen at completion (treat it as read-only)"""
+        if self._cached_dict is not None:
+            return self._cached_dict
+        return self.to_dict()
+    
+    def get_status_json(self) -> bytes:
+        """API payload as JSON bytes; encoded once for finished jobs"""
+        if self._cached_dict is None:
+            return _encode_job(self.to_dict())
+        if self._cached_json is None:
+            self._cached_json = _encode_job(self._cached_dict)
+        return self._cached_json
     
     def get_duration(self) -> Optional[float]:
         """Get job processing duration"""
@@ -108,7 +227,7 @@ class TTSJob:
         return None
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert job to dictionary for API response"""
+        """Convert job to dictionary for API response (see get_status_dict for the cached form)"""
         return {
             "job_id": self.job_id,
             "job_type": self.job_type,
@@ -131,11 +250,98 @@ class TTSJob:
                 "error_message": self.result.error_message if self.result else None,
                 "processing_stats": self.result.processing_stats if self.result else None
             } if self.result else None,
+            # Top-level fields of the API's JobStatusResponse, served from this payload as is
+            "error": self.result.error_message if self.result and not self.result.success else None,
+            "estimated_remaining_time": self.progress.estimated_remaining_time,
             "gpu_id": self.gpu_id,
             "retry_count": self.retry_count
         }
 
 
+class CheckpointPersistence:
+    """
+    One JSON file per unfinished job so a restarted manager can pick its work back up
+    
+    Writes run on a single background thread: they never block the event loop and
+    land on disk in the order they were issued.
+    """
+    
+    def __init__(self, checkpoint_dir: str):
+        self.logger = logging.getLogger(__name__)
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-checkpoint")
+    
+    def _path(self, job_id: str) -> Path:
+        return self.checkpoint_dir / f"{job_id}.json"
+    
+    def _write(self, job_id: str, record: Dict[str, Any]):
+        path = self._path(job_id)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f)
+        os.replace(tmp_path, path)
+    
+    def _remove(self, job_id: str):
+        try:
+            self._path(job_id).unlink()
+        except FileNotFoundError:
+            pass
+    
+    def _submit(self, fn: Callable, job_id: str, *args):
+        def log_failure(future):
+            if future.exception() is not None:
+                self.logger.error("Checkpoint update for job %s failed: %s", job_id, future.exception())
+        
+        self._executor.submit(fn, job_id, *args).add_done_callback(log_failure)
+    
+    @staticmethod
+    def _job_record(job: TTSJob, status: JobStatus) -> Dict[str, Any]:
+        return {
+            "job_id": job.job_id,
+            "job_type": job.job_type,
+            "request_data": job.request_data.to_dict(),
+            "status": status.value,
+            "priority": job.priority.value,
+            "created_at": job.created_at,
+            "started_at": job.started_at,
+            "worker_id": job.worker_id,
+            "estimated_duration": job.estimated_duration,
+            "retry_count": job.retry_count,
+            "max_retries": job.max_retries,
+            "client_ip": job.client_ip,
+            "user_agent": job.user_agent
+        }
+    
+    def record_queued(self, job: TTSJob):
+        """Checkpoint a job waiting in the queue (also used when a retry is scheduled)"""
+        self._submit(self._write, job.job_id, self._job_record(job, JobStatus.QUEUED))
+    
+    def record_started(self, job: TTSJob):
+        """Checkpoint a job a worker has picked up"""
+        self._submit(self._write, job.job_id, self._job_record(job, JobStatus.PROCESSING))
+    
+    def record_finished(self, job_id: str):
+        """Drop the checkpoint of a completed, failed or cancelled job"""
+        self._submit(self._remove, job_id)
+    
+    async def flush(self):
+        """Wait until every checkpoint issued so far is on disk"""
+        await asyncio.get_running_loop().run_in_executor(self._executor, lambda: None)
+    
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Read every stored checkpoint, oldest job first; unreadable files are skipped"""
+        records = []
+        for path in self.checkpoint_dir.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    records.append(json.load(f))
+            except (OSError, ValueError) as e:
+                self.logger.warning("Skipping unreadable checkpoint %s: %s", path.name, e)
+        records.sort(key=lambda record: record.get("created_at", 0.0))
+        return records
+
+
 class RequestQueueManager:
     """
     Advanced request queue manager for concurrent TTS processing
@@ -151,7 +357,8 @@ class RequestQueueManager:
     
     def __init__(self, max_concurrent_jobs: int = 10, 
                  max_queue_size: int = 100,
-                 default_timeout: float = 300.0):
+                 default_timeout: float = 300.0,
+                 checkpoint_dir: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         
         # Configuration
@@ -161,32 +368,48 @@ class RequestQueueManager:
         
         # Job storage and queues
         self.jobs: Dict[str, TTSJob] = {}
+        # Items are (-priority, sequence, job_id); the sequence keeps equal priorities FIFO
         self.pending_queue = asyncio.PriorityQueue()
+        self._seq = itertools.count()
         self.processing_jobs: Dict[str, TTSJob] = {}
+        # Number of stored jobs per status, kept in step with every status transition
+        self._status_counts: Dict[JobStatus, int] = {status: 0 for status in JobStatus}
+        # (completed_at, job_id) of finished jobs, oldest first, so cleanup only visits expired ones
+        self._completion_order: Deque[Tuple[float, str]] = deque()
         
-        # Worker management
+        # Worker management (the fixed worker count bounds concurrency)
         self.workers: Dict[str, asyncio.Task] = {}
-        self.worker_semaphore = asyncio.Semaphore(max_concurrent_jobs)
         
-        # Performance tracking
+        # Performance tracking (queue_size/active_workers are read live in get_queue_status)
         self.stats = {
             "total_jobs": 0,
             "completed_jobs": 0,
             "failed_jobs": 0,
             "cancelled_jobs": 0,
             "average_processing_time": 0.0,
-            "queue_size": 0,
-            "active_workers": 0,
             "total_processing_time": 0.0
         }
         
-        # Rate limiting (requests per minute per IP)
-        self.rate_limits: Dict[str, List[float]] = {}
+        # Rate limiting (requests per minute per IP): token bucket per client,
+        # client_ip -> (tokens, last_refill), ordered least recently seen first
+        self.rate_limits: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
         self.max_requests_per_minute = 10
+        self.max_rate_limit_clients = RATE_LIMIT_MAX_CLIENTS
+        
+        # Crash recovery: unfinished jobs are checkpointed when a directory is configured
+        self._persistence: Optional[CheckpointPersistence] = (
+            CheckpointPersistence(checkpoint_dir) if checkpoint_dir else None
+        )
+        
+        # One TTS service per worker, created for its first job. TTSService keeps unlocked
+        # per-instance state (performance optimizer caches and history), and a worker runs
+        # one job at a time, so no service is ever used by two synthesis threads at once
+        self._tts_services: Dict[str, Any] = {}
+        # Synthesis is blocking, so it runs on these threads while the event loop keeps serving
+        self._executor: Optional[ThreadPoolExecutor] = None
         
         # Background tasks
         self._cleanup_task: Optional[asyncio.Task] = None
-        self._stats_task: Optional[asyncio.Task] = None
         self._running = False
     
     async def start(self):
@@ -197,9 +420,13 @@ class RequestQueueManager:
         self._running = True
         self.logger.info("Starting Request Queue Manager")
         
+        if self._persistence:
+            self._restore_checkpoints()
+        
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrent_jobs, thread_name_prefix="tts")
+        
         # Start background tasks
         self._cleanup_task = asyncio.create_task(self._cleanup_loop())
-        self._stats_task = asyncio.create_task(self._stats_loop())
         
         # Start worker pool
         for i in range(self.max_concurrent_jobs):
@@ -208,6 +435,55 @@ class RequestQueueManager:
                 self._worker_loop(worker_id)
             )
     
+    def _release_unfinished(self, statuses):
+        """Drop unfinished jobs from memory, leaving their checkpoints for _restore_checkpoints"""
+        released = [job_id for job_id, job in self.jobs.items() if job.status in statuses]
+        for job_id in released:
+            job = self.jobs.pop(job_id)
+            self._status_counts[job.status] -= 1
+        if released:
+            self.logger.info("Left %s unfinished jobs to their checkpoints", len(released))
+    
+    def _restore_checkpoints(self):
+        """Queue the jobs left unfinished by a previous run"""
+        restored = 0
+        for record in self._persistence.load_all():
+            job_id = record["job_id"]
+            if job_id in self.jobs:
+                continue
+            
+            job = TTSJob(
+                job_id=job_id,
+                job_type=record["job_type"],
+                request_data=TTSRequest.from_dict(record["request_data"]),
+                priority=JobPriority(record["priority"]),
+                created_at=record["created_at"],
+                estimated_duration=record["estimated_duration"],
+                retry_count=record["retry_count"],
+                max_retries=record["max_retries"],
+                client_ip=record["client_ip"],
+                user_agent=record["user_agent"]
+            )
+            
+            # A job that was mid-synthesis when the process died counts as a failed attempt
+            if record["status"] == JobStatus.PROCESSING.value:
+                if job.retry_count >= job.max_retries:
+                    self.logger.warning("Dropping interrupted job %s: no retries left", job_id)
+                    self._persistence.record_finished(job_id)
+                    continue
+                job.retry_count += 1
+            
+            self.jobs[job_id] = job
+            self._status_counts[job.status] += 1
+            self._set_status(job, JobStatus.QUEUED)
+            self.pending_queue.put_nowait((-job.priority.value, next(self._seq), job_id))
+            self._persistence.record_queued(job)
+            self.stats["total_jobs"] += 1
+            restored += 1
+        
+        if restored:
+            self.logger.info("Restored %s unfinished jobs from checkpoints", restored)
+    
     async def stop(self):
         """Stop the queue manager and clean up"""
         if not self._running:
@@ -216,25 +492,45 @@ class RequestQueueManager:
         self.logger.info("Stopping Request Queue Manager")
         self._running = False
         
-        # Cancel all pending jobs
-        pending_jobs = [job for job in self.jobs.values() 
-                       if job.status in [JobStatus.PENDING, JobStatus.QUEUED]]
-        for job in pending_jobs:
-            await self.cancel_job(job.job_id)
+        # Cancel all pending jobs; with checkpoints they are handed over to the next start() instead
+        if self._persistence:
+            self._release_unfinished(_CANCELLABLE)
+        else:
+            for job in self.jobs.values():
+                if job.status in _CANCELLABLE:
+                    self._cancel(job)
         
         # Stop background tasks
         if self._cleanup_task:
             self._cleanup_task.cancel()
-        if self._stats_task:
-            self._stats_task.cancel()
         
-        # Stop workers
-        for worker_task in self.workers.values():
+        # Stop workers: idle ones wake on a stop item and exit, busy ones get a grace period
+        for _ in self.workers:
+            self.pending_queue.put_nowait(_WORKER_STOP)
+        _, busy = await asyncio.wait(self.workers.values(), timeout=SHUTDOWN_GRACE_PERIOD)
+        for worker_task in busy:
             worker_task.cancel()
         
         # Wait for graceful shutdown
         await asyncio.gather(*self.workers.values(), return_exceptions=True)
         
+        if self._persistence:
+            # Jobs interrupted mid-synthesis are retried from their checkpoints as well
+            self._release_unfinished({JobStatus.PROCESSING})
+            await self._persistence.flush()
+        
+        # Leftovers (released jobs, stop items of cancelled workers) must not reach the next workers
+        while not self.pending_queue.empty():
+            self.pending_queue.get_nowait()
+        
+        # Threads of workers cancelled mid-synthesis finish in the background
+        self._executor.shutdown(wait=False)
+        self._executor = None
+        
+        for tts_service in self._tts_services.values():
+            tts_service.cleanup()
+        self._tts_services.clear()
+        
         self.logger.info("Request Queue Manager stopped")
     
     def check_rate_limit(self, client_ip: str) -> bool:
@@ -242,27 +538,46 @@ class RequestQueueManager:
         if not client_ip:
             return True
         
-        current_time = time.time()
-        minute_ago = current_time - 60
+        current_time = time.monotonic()
+        capacity = float(self.max_requests_per_minute)
         
-        # Clean old requests
-        if client_ip in self.rate_limits:
-            self.rate_limits[client_ip] = [
-                req_time for req_time in self.rate_limits[client_ip]
-                if req_time > minute_ago
-            ]
+        # Refill the client's bucket for the time since its last request (new clients start full)
+        bucket = self.rate_limits.get(client_ip)
+        if bucket is None:
+            tokens = capacity
         else:
-            self.rate_limits[client_ip] = []
+            tokens, last_refill = bucket
+            tokens = min(capacity, tokens + (current_time - last_refill) * (capacity / 60.0))
         
-        # Check rate limit
-        if len(self.rate_limits[client_ip]) >= self.max_requests_per_minute:
-            return False
+        # Check rate limit; a request consumes one token
+        allowed = tokens >= 1.0
+        if allowed:
+            tokens -= 1.0
         
-        # Record new request
-        self.rate_limits[client_ip].append(current_time)
-        return True
+        self.rate_limits[client_ip] = (tokens, current_time)
+        self.rate_limits.move_to_end(client_ip)
+        # Evict least recently seen clients (a loop, so lowering the cap takes effect at once)
+        while len(self.rate_limits) > self.max_rate_limit_clients:
+            self.rate_limits.popitem(last=False)
+        
+        return allowed
+    
+    def _set_status(self, job: TTSJob, new_status: JobStatus):
+        """Transition a stored job to a new status, keeping the status counters in step"""
+        self._status_counts[job.status] -= 1
+        job.status = new_status
+        self._status_counts[new_status] += 1
+    
+    def _set_result(self, job: TTSJob, result: JobResult):
+        """Set a stored job's result (which also sets its final status), keeping the counters in step"""
+        self._status_counts[job.status] -= 1
+        job.set_result(result)
+        self._status_counts[job.status] += 1
+        self._completion_order.append((job.completed_at, job.job_id))
+        if self._persistence:
+            self._persistence.record_finished(job.job_id)
     
-    async def submit_job(self, job_type: str, request_data: Dict[str, Any],
+    async def submit_job(self, job_type: str, request_data: Union[TTSRequest, Dict[str, Any]],
                         priority: JobPriority = JobPriority.NORMAL,
                         client_ip: Optional[str] = None,
                         user_agent: Optional[str] = None) -> str:
@@ -271,7 +586,7 @@ class RequestQueueManager:
         
         Args:
             job_type: Type of TTS job ("interactive_voice" | "voice_cloning")
-            request_data: Job request parameters
+            request_data: Job request parameters (a TTSRequest, or a dict parsed into one)
             priority: Job priority level
             client_ip: Client IP address for rate limiting
             user_agent: Client user agent
@@ -280,7 +595,7 @@ class RequestQueueManager:
             Job ID for tracking
             
         Raises:
-            ValueError: If queue is full or rate limit exceeded
+            ValueError: If queue is full, rate limit exceeded or the request has no text
         """
         # Check rate limit
         if not self.check_rate_limit(client_ip):
@@ -290,6 +605,9 @@ class RequestQueueManager:
         if len(self.jobs) >= self.max_queue_size:
             raise ValueError("Queue is full, please try again later")
         
+        if not isinstance(request_data, TTSRequest):
+            request_data = TTSRequest.from_dict(request_data)
+        
         # Create job
         job_id = str(uuid.uuid4())
         job = TTSJob(
@@ -302,30 +620,22 @@ class RequestQueueManager:
         )
         
         # Estimate processing duration based on text length
-        text = request_data.get("text", "")
-        text_length = len(text)
-        
-        if text_length < 500:
-            job.estimated_duration = 15.0
-        elif text_length < 2000:
-            job.estimated_duration = 30.0
-        elif text_length < 5000:
-            job.estimated_duration = 60.0
-        else:
-            job.estimated_duration = 120.0
+        job.estimated_duration = _DURATION_VALUES[bisect.bisect_right(_DURATION_TIERS, request_data.text_length)]
         
         # Store job
         self.jobs[job_id] = job
-        job.status = JobStatus.QUEUED
+        self._status_counts[job.status] += 1
+        self._set_status(job, JobStatus.QUEUED)
         
         # Add to priority queue (negative priority for max-heap behavior)
-        await self.pending_queue.put((-priority.value, time.time(), job_id))
+        await self.pending_queue.put((-priority.value, next(self._seq), job_id))
+        if self._persistence:
+            self._persistence.record_queued(job)
         
         # Update stats
         self.stats["total_jobs"] += 1
-        self.stats["queue_size"] = len(self.jobs)
         
-        self.logger.info(f"Submitted job {job_id} ({job_type}) with priority {priority.name}")
+        self.logger.info("Submitted job %s (%s) with priority %s", job_id, job_type, priority.name)
         
         return job_id
     
@@ -335,7 +645,14 @@ class RequestQueueManager:
             return None
         
         job = self.jobs[job_id]
-        return job.to_dict()
+        return job.get_status_dict()
+    
+    async def get_job_status_json(self, job_id: str) -> Optional[bytes]:
+        """Get job status as serialized JSON, ready for Response(content=..., media_type="application/json")"""
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        return job.get_status_json()
     
     async def cancel_job(self, job_id: str) -> bool:
         """Cancel a job if it's still pending or queued"""
@@ -344,68 +661,65 @@ class RequestQueueManager:
         
         job = self.jobs[job_id]
         
-        if job.status in [JobStatus.PENDING, JobStatus.QUEUED]:
-            job.status = JobStatus.CANCELLED
-            job.completed_at = time.time()
-            self.stats["cancelled_jobs"] += 1
-            self.logger.info(f"Cancelled job {job_id}")
+        if job.status in _CANCELLABLE:
+            self._cancel(job)
+            if self._persistence:
+                self._persistence.record_finished(job_id)
             return True
         
         return False
     
+    def _cancel(self, job: TTSJob):
+        """Mark a pending or queued job as cancelled"""
+        self._set_status(job, JobStatus.CANCELLED)
+        job.completed_at = time.time()
+        job._cached_dict = job.to_dict()
+        self._completion_order.append((job.completed_at, job.job_id))
+        self.stats["cancelled_jobs"] += 1
+        self.logger.info("Cancelled job %s", job.job_id)
+    
     async def _worker_loop(self, worker_id: str):
         """Main worker loop for processing jobs"""
-        self.logger.info(f"Worker {worker_id} started")
+        self.logger.info("Worker %s started", worker_id)
         
-        while self._running:
+        while True:
             try:
-                # Wait for semaphore (rate limiting)
-                async with self.worker_semaphore:
-                    # Get next job from queue
-                    try:
-                        priority, timestamp, job_id = await asyncio.wait_for(
-                            self.pending_queue.get(), timeout=1.0
-                        )
-                    except asyncio.TimeoutError:
-                        continue
-                    
-                    if job_id not in self.jobs:
-                        continue
-                    
-                    job = self.jobs[job_id]
-                    
-                    # Skip cancelled jobs
-                    if job.status == JobStatus.CANCELLED:
-                        continue
-                    
-                    # Process the job
-                    await self._process_job(job, worker_id)
-                    
+                # Block until the next job (or a stop item) arrives
+                _, _, job_id = await self.pending_queue.get()
+                if job_id is None:
+                    break
+                
+                # Skip jobs that were cleaned up or cancelled while queued
+                job = self.jobs.get(job_id)
+                if job is None or job.status != JobStatus.QUEUED:
+                    continue
+                
+                # Process the job
+                await self._process_job(job, worker_id)
+                
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Worker {worker_id} error: {e}")
+                self.logger.error("Worker %s error: %s", worker_id, e)
                 await asyncio.sleep(1)
         
-        self.logger.info(f"Worker {worker_id} stopped")
+        self.logger.info("Worker %s stopped", worker_id)
     
     async def _process_job(self, job: TTSJob, worker_id: str):
         """Process a single TTS job"""
-        job.status = JobStatus.PROCESSING
+        self._set_status(job, JobStatus.PROCESSING)
         job.started_at = time.time()
         job.worker_id = worker_id
         job.update_progress("starting", 0, "Initializing TTS processing")
         
         self.processing_jobs[job.job_id] = job
-        self.stats["active_workers"] = len(self.processing_jobs)
+        if self._persistence:
+            self._persistence.record_started(job)
         
-        self.logger.info(f"Worker {worker_id} processing job {job.job_id}")
+        self.logger.info("Worker %s processing job %s", worker_id, job.job_id)
         
         try:
-            # Import TTS service here to avoid circular imports
-            from ..api.services import TTSService
-            
-            tts_service = TTSService()
+            tts_service = self._get_tts_service(worker_id)
             
             # Update progress
             job.update_progress("processing", 10, "TTS service initialized")
@@ -419,7 +733,7 @@ class RequestQueueManager:
                 raise ValueError(f"Unknown job type: {job.job_type}")
             
             # Set result
-            job.set_result(result)
+            self._set_result(job, result)
             
             # Update stats
             if result.success:
@@ -436,217 +750,244 @@ class RequestQueueManager:
                     (self.stats["completed_jobs"] + self.stats["failed_jobs"])
                 )
             
-            self.logger.info(f"Job {job.job_id} completed in {duration:.2f}s")
+            self.logger.info("Job %s completed in %.2fs", job.job_id, duration)
             
         except Exception as e:
-            self.logger.error(f"Job {job.job_id} failed: {e}")
+            self.logger.error("Job %s failed: %s", job.job_id, e)
             
             # Handle retry logic
             if job.retry_count < job.max_retries:
                 job.retry_count += 1
-                job.status = JobStatus.QUEUED
+                self._set_status(job, JobStatus.QUEUED)
                 job.started_at = None
                 job.update_progress("retrying", 0, f"Retrying (attempt {job.retry_count})")
+                if self._persistence:
+                    self._persistence.record_queued(job)
                 
                 # Re-queue job with delay
                 await asyncio.sleep(5)
-                await self.pending_queue.put((-job.priority.value, time.time(), job.job_id))
+                await self.pending_queue.put((-job.priority.value, next(self._seq), job.job_id))
                 
-                self.logger.info(f"Retrying job {job.job_id} (attempt {job.retry_count})")
+                self.logger.info("Retrying job %s (attempt %s)", job.job_id, job.retry_count)
             else:
                 # Mark as failed
                 result = JobResult(
                     success=False,
                     error_message=str(e)
                 )
-                job.set_result(result)
+                self._set_result(job, result)
                 self.stats["failed_jobs"] += 1
         
         finally:
             # Clean up
             if job.job_id in self.processing_jobs:
                 del self.processing_jobs[job.job_id]
-            self.stats["active_workers"] = len(self.processing_jobs)
     
-    async def _process_interactive_voice(self, job: TTSJob, tts_service) -> JobResult:
-        """Process interactive voice synthesis job"""
-        data = job.request_data
+    def _get_tts_service(self, worker_id: str):
+        """The worker's TTS service, built once rather than per job (models come from the global cache)"""
+        tts_service = self._tts_services.get(worker_id)
+        if tts_service is None:
+            # Import TTS service here to avoid circular imports
+            from ..api.services import TTSService
+            tts_service = self._tts_services[worker_id] = TTSService()
+        return tts_service
+    
+    @staticmethod
+    def _make_progress_callback(job: TTSJob) -> Callable[[Dict[str, Any]], None]:
+        """
+        Progress callback for synthesis running on an executor thread
+        
+        Updates are thinned to stage changes and steps of PROGRESS_MIN_STEP, and applied
+        on the event loop so status readers never see a half-written progress.
+        """
+        loop = asyncio.get_running_loop()
+        last_stage = None
+        last_progress = 0.0
         
-        # Progress callback
         def progress_callback(info):
+            nonlocal last_stage, last_progress
             stage = info.get("stage", "processing")
             progress = info.get("progress", 50)
-            message = info.get("message", "Processing...")
-            job.update_progress(stage, progress, message)
+            if stage == last_stage and abs(progress - last_progress) < PROGRESS_MIN_STEP:
+                return
+            last_stage, last_progress = stage, progress
+            loop.call_soon_threadsafe(job.update_progress, stage, progress, info.get("message", "Processing..."))
+        
+        return progress_callback
+    
+    async def _run_in_executor(self, fn: Callable, **kwargs):
+        """Run a blocking TTS call on the synthesis threads"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, **kwargs))
+    
+    @staticmethod
+    def _result_from_response(response) -> JobResult:
+        """Successful job result from a TTS service response"""
+        return JobResult(
+            success=True,
+            data=getattr(response, '__dict__', {}),
+            audio_base64=getattr(response, 'audio_data', None),
+            audio_file_path=getattr(response, 'audio_file_path', None),
+            processing_stats={
+                "generation_time": getattr(response, 'generation_time', 0),
+                "total_time": getattr(response, 'total_time', 0),
+                "chunking_used": getattr(response, 'chunking_used', False)
+            }
+        )
+    
+    async def _process_interactive_voice(self, job: TTSJob, tts_service) -> JobResult:
+        """Process interactive voice synthesis job"""
+        data = job.request_data
+        
+        progress_callback = self._make_progress_callback(job)
         
         job.update_progress("synthesis", 20, "Starting voice synthesis")
         
         # Call TTS service
-        response = tts_service.synthesize_interactive_voice(
-            text=data["text"],
-            gender=data.get("gender", "female"),
-            group=data.get("group", "story"),
-            area=data.get("area", "northern"),
-            emotion=data.get("emotion", "neutral"),
-            speed=data.get("speed", 1.0),
-            random_seed=data.get("random_seed", 9527),
-            enable_chunking=data.get("enable_chunking", True),
-            chunk_overlap=data.get("chunk_overlap", 50),
-            prosody_consistency=data.get("prosody_consistency", 1.0),
+        response = await self._run_in_executor(
+            tts_service.synthesize_interactive_voice,
+            text=data.text,
+            gender=data.gender,
+            group=data.group,
+            area_or_accent=data.area,
+            emotion=data.emotion,
+            speed=data.speed,
+            random_seed=data.random_seed,
+            enable_chunking=data.enable_chunking,
+            chunk_overlap=data.chunk_overlap,
+            prosody_consistency=data.prosody_consistency,
             progress_callback=progress_callback
         )
         
         job.update_progress("finalizing", 90, "Finalizing results")
         
-        return JobResult(
-            success=True,
-            data=response.__dict__ if hasattr(response, '__dict__') else {},
-            audio_base64=response.audio_data if hasattr(response, 'audio_data') else None,
-            audio_file_path=response.audio_file_path if hasattr(response, 'audio_file_path') else None,
-            processing_stats={
-                "generation_time": response.generation_time if hasattr(response, 'generation_time') else 0,
-                "total_time": response.total_time if hasattr(response, 'total_time') else 0,
-                "chunking_used": response.chunking_used if hasattr(response, 'chunking_used') else False
-            }
-        )
+        return self._result_from_response(response)
     
     async def _process_voice_cloning(self, job: TTSJob, tts_service) -> JobResult:
         """Process voice cloning synthesis job"""
         data = job.request_data
         
-        # Progress callback
-        def progress_callback(info):
-            stage = info.get("stage", "processing")
-            progress = info.get("progress", 50)
-            message = info.get("message", "Processing...")
-            job.update_progress(stage, progress, message)
+        progress_callback = self._make_progress_callback(job)
         
         job.update_progress("cloning", 20, "Starting voice cloning")
         
         # Call TTS service
-        response = tts_service.synthesize_voice_cloning(
-            text=data["text"],
-            use_default_sample=data.get("use_default_sample", True),
-            default_sample_id=data.get("default_sample_id"),
-            reference_text=data.get("reference_text"),
-            reference_audio_base64=data.get("reference_audio_base64"),
-            speed=data.get("speed", 1.0),
-            random_seed=data.get("random_seed", 9527),
-            enable_chunking=data.get("enable_chunking", True),
-            chunk_overlap=data.get("chunk_overlap", 50),
-            voice_consistency=data.get("voice_consistency", 1.0),
+        response = await self._run_in_executor(
+            tts_service.synthesize_voice_cloning,
+            text=data.text,
+            use_default_sample=data.use_default_sample,
+            default_sample_id=data.default_sample_id,
+            reference_text=data.reference_text,
+            reference_audio_base64=data.reference_audio_base64,
+            speed=data.speed,
+            random_seed=data.random_seed,
+            enable_chunking=data.enable_chunking,
+            chunk_overlap=data.chunk_overlap,
+            voice_consistency=data.voice_consistency,
             progress_callback=progress_callback
         )
         
         job.update_progress("finalizing", 90, "Finalizing results")
         
-        return JobResult(
-            success=True,
-            data=response.__dict__ if hasattr(response, '__dict__') else {},
-            audio_base64=response.audio_data if hasattr(response, 'audio_data') else None,
-            audio_file_path=response.audio_file_path if hasattr(response, 'audio_file_path') else None,
-            processing_stats={
-                "generation_time": response.generation_time if hasattr(response, 'generation_time') else 0,
-                "total_time": response.total_time if hasattr(response, 'total_time') else 0,
-                "chunking_used": response.chunking_used if hasattr(response, 'chunking_used') else False
-            }
-        )
+        return self._result_from_response(response)
     
     async def _cleanup_loop(self):
         """Background task to clean up old completed jobs"""
         while self._running:
             try:
-                current_time = time.time()
                 cleanup_threshold = 3600  # 1 hour
+                expired_before = time.time() - cleanup_threshold
                 
-                # Find jobs to clean up
-                jobs_to_cleanup = []
-                for job_id, job in self.jobs.items():
-                    if (job.status in [JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED] and
-                        job.completed_at and 
-                        current_time - job.completed_at > cleanup_threshold):
-                        jobs_to_cleanup.append(job_id)
-                
-                # Clean up old jobs
-                for job_id in jobs_to_cleanup:
-                    del self.jobs[job_id]
-                    self.logger.debug(f"Cleaned up old job {job_id}")
-                
-                if jobs_to_cleanup:
-                    self.stats["queue_size"] = len(self.jobs)
+                # Finished jobs are queued in completion order, so stop at the first unexpired one
+                completion_order = self._completion_order
+                while completion_order and completion_order[0][0] < expired_before:
+                    _, job_id = completion_order.popleft()
+                    job = self.jobs.pop(job_id, None)
+                    if job is not None:
+                        self._status_counts[job.status] -= 1
+                        self.logger.debug("Cleaned up old job %s", job_id)
                 
                 await asyncio.sleep(300)  # Run every 5 minutes
                 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                self.logger.error(f"Cleanup loop error: {e}")
+                self.logger.error("Cleanup loop error: %s", e)
                 await asyncio.sleep(60)
     
-    async def _stats_loop(self):
-        """Background task to update statistics"""
-        while self._running:
-            try:
-                self.stats["queue_size"] = len(self.jobs)
-                self.stats["active_workers"] = len(self.processing_jobs)
-                
-                await asyncio.sleep(10)  # Update every 10 seconds
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                self.logger.error(f"Stats loop error: {e}")
-                await asyncio.sleep(30)
-    
     def get_queue_status(self) -> Dict[str, Any]:
         """Get comprehensive queue status"""
         return {
             "queue_status": {
                 "total_jobs": len(self.jobs),
-                "pending_jobs": len([j for j in self.jobs.values() if j.status == JobStatus.PENDING]),
-                "queued_jobs": len([j for j in self.jobs.values() if j.status == JobStatus.QUEUED]),
+                "pending_jobs": self._status_counts[JobStatus.PENDING],
+                "queued_jobs": self._status_counts[JobStatus.QUEUED],
                 "processing_jobs": len(self.processing_jobs),
-                "completed_jobs": len([j for j in self.jobs.values() if j.status == JobStatus.COMPLETED]),
-                "failed_jobs": len([j for j in self.jobs.values() if j.status == JobStatus.FAILED]),
-                "cancelled_jobs": len([j for j in self.jobs.values() if j.status == JobStatus.CANCELLED]),
+                "completed_jobs": self._status_counts[JobStatus.COMPLETED],
+                "failed_jobs": self._status_counts[JobStatus.FAILED],
+                "cancelled_jobs": self._status_counts[JobStatus.CANCELLED],
+            },
+            "performance_stats": {
+                **self.stats,
+                "queue_size": len(self.jobs),
+                "active_workers": len(self.processing_jobs)
             },
-            "performance_stats": self.stats,
             "configuration": {
                 "max_concurrent_jobs": self.max_concurrent_jobs,
                 "max_queue_size": self.max_queue_size,
                 "default_timeout": self.default_timeout,
-                "max_requests_per_minute": self.max_requests_per_minute
+                "max_requests_per_minute": self.max_requests_per_minute,
+                "max_rate_limit_clients": self.max_rate_limit_clients
             }
         }
 
 
 # Global queue manager instance
 _queue_manager: Optional[RequestQueueManager] = None
+# Serializes creation/replacement/shutdown of the global manager; created on first use so it
+# binds to the running event loop
+_init_lock: Optional[asyncio.Lock] = None
+
+
+def _get_init_lock() -> asyncio.Lock:
+    global _init_lock
+    if _init_lock is None:
+        _init_lock = asyncio.Lock()
+    return _init_lock
 
 
 async def get_queue_manager() -> RequestQueueManager:
     """Get the global queue manager instance"""
     global _queue_manager
-    if _queue_manager is None:
-        _queue_manager = RequestQueueManager()
-        await _queue_manager.start()
+    # Fast path once the manager exists; the lock only serializes creation
+    manager = _queue_manager
+    if manager is not None:
+        return manager
+    async with _get_init_lock():
+        if _queue_manager is None:
+            _queue_manager = RequestQueueManager()
+            await _queue_manager.start()
     return _queue_manager
 
 
-async def initialize_queue_manager(max_concurrent_jobs: int = 10) -> RequestQueueManager:
+async def initialize_queue_manager(max_concurrent_jobs: int = 10,
+                                   checkpoint_dir: Optional[str] = None) -> RequestQueueManager:
     """Initialize the global queue manager with custom settings"""
     global _queue_manager
-    if _queue_manager is not None:
-        await _queue_manager.stop()
-    
-    _queue_manager = RequestQueueManager(max_concurrent_jobs=max_concurrent_jobs)
-    await _queue_manager.start()
+    async with _get_init_lock():
+        if _queue_manager is not None:
+            await _queue_manager.stop()
+        
+        _queue_manager = RequestQueueManager(max_concurrent_jobs=max_concurrent_jobs,
+                                             checkpoint_dir=checkpoint_dir)
+        await _queue_manager.start()
     return _queue_manager
 
 
 async def shutdown_queue_manager():
     """Shutdown the global queue manager"""
     global _queue_manager
-    if _queue_manager is not None:
-        await _queue_manager.stop()
-        _queue_manager = None
+    async with _get_init_lock():
+        if _queue_manager is not None:
+            await _queue_manager.stop()
+            _queue_manager = None
@@ -5,7 +5,28 @@ Text processing utilities for TTS inference
 import re
 import numpy as np
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Pattern, Union
+
+
+# Characters clean_text keeps: alphabet, vietnamese characters, space, punctuation
+_ALPHABET_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+_VIETNAMESE_CHARS = "àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệđìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳỵỷỹýỳỵỷỹ"
+_PUNCTUATION_CHARS = " .,!?'@$%&/:;()"
+_VALID_CHARS = "".join(sorted(set(
+    _ALPHABET_CHARS + _ALPHABET_CHARS.upper() + _VIETNAMESE_CHARS + _VIETNAMESE_CHARS.upper() + _PUNCTUATION_CHARS
+)))
+
+# Lowercase accented characters counted by _calculate_text_complexity
+_ACCENT_CHARS = frozenset("àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệđìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳỵỷỹý")
+
+_RE_INVALID = re.compile(f"[^{re.escape(_VALID_CHARS)}]")
+_RE_COLON_PARENS = re.compile(r'[;:()]')
+_RE_MULTI_DOT = re.compile(r'\.+')
+_RE_MULTI_COMMA = re.compile(r',+')
+_RE_MULTI_SPACE = re.compile(r'\s+')
+_RE_NUMBERS = re.compile(r'\d+')
+_RE_PUNCT = re.compile(r'[.,;:!?()"]')
+_RE_SENT_SPLIT = re.compile(r'(?<=[.!?]) +')
 
 
 class TextProcessor:
@@ -35,20 +56,15 @@ class TextProcessor:
         ]
         return np.stack(list_idx_tensors, axis=0)
     
-    def calculate_text_length(self, text: str, pause_punc: str) -> int:
+    def calculate_text_length(self, text: str, pause_punc: Union[str, Pattern]) -> int:
         """Calculate text length including pause punctuation weighting"""
-        return len(text.encode('utf-8')) + 3 * len(re.findall(pause_punc, text))
+        if isinstance(pause_punc, str):
+            pause_punc = re.compile(pause_punc)
+        return len(text.encode('utf-8')) + 3 * len(pause_punc.findall(text))
     
     def clean_text(self, text: str) -> str:
         """Clean text to keep only readable characters"""
-        # only keep readable characters in alphabet, vietnamese characters, space, punctuation
-        alphabet_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
-        vietnamese_chars = "àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệđìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳỵỷỹýỳỵỷỹ"
-        punctuation_chars = " .,!?'@$%&/:;()"
-        all_valid_chars = alphabet_chars + alphabet_chars.upper() + vietnamese_chars + vietnamese_chars.upper() + punctuation_chars
-        all_valid_chars = list(set(all_valid_chars))
-        
-        # replace all invalid characters with space using all_valid_chars and regex
+        # replace all invalid characters (see _VALID_CHARS) with space
         if "\n" in text:
             chunks = [chunk.strip() for chunk in text.split("\n") if chunk.strip()]
             for idx, chunk in enumerate(chunks):
@@ -56,15 +72,15 @@ class TextProcessor:
                     chunks[idx] = chunk.strip() + "."
             text = " ".join(chunks)
 
-        text = re.sub(f"[^{''.join(all_valid_chars)}]", " ", text)
+        text = _RE_INVALID.sub(" ", text)
         text = text.strip()
         # replace ;:() with ,
-        text = re.sub(r'[;:()]', ',', text)
+        text = _RE_COLON_PARENS.sub(',', text)
         
         # make sure no duplicate ,.
-        text = re.sub(r'\.+', '.', text)
-        text = re.sub(r',+', ',', text)
-        text = re.sub(r'\s+', ' ', text)
+        text = _RE_MULTI_DOT.sub('.', text)
+        text = _RE_MULTI_COMMA.sub(',', text)
+        text = _RE_MULTI_SPACE.sub(' ', text)
         
         # Append . at the end of the text if it doesn't end with . or ? or ! or ,
         if not text.endswith(('.', '?', '!', ',')):
@@ -87,7 +103,7 @@ class TextProcessor:
             return 0.0
         
         # Number density
-        number_count = len(re.findall(r'\d+', text))
+        number_count = len(_RE_NUMBERS.findall(text))
         number_density = number_count / len(words)
         complexity += min(number_density * 2, 0.3)  # Cap at 0.3
         
@@ -97,14 +113,13 @@ class TextProcessor:
             complexity += min((avg_word_length - 6) * 0.1, 0.2)  # Cap at 0.2
         
         # Vietnamese accent density
-        vietnamese_chars = "àáảãạăằắẳẵặâầấẩẫậèéẻẽẹêềếểễệđìíỉĩịòóỏõọôồốổỗộơờớởỡợùúủũụưừứửữựỳỵỷỹý"
-        accent_count = sum(1 for char in text.lower() if char in vietnamese_chars)
+        accent_count = sum(1 for char in text.lower() if char in _ACCENT_CHARS)
         accent_density = accent_count / len(text) if text else 0
         if accent_density > 0.3:
             complexity += min((accent_density - 0.3) * 0.5, 0.2)  # Cap at 0.2
         
         # Punctuation density
-        punct_count = len(re.findall(r'[.,;:!?()"]', text))
+        punct_count = len(_RE_PUNCT.findall(text))
         punct_density = punct_count / len(text) if text else 0
         if punct_density > 0.1:
             complexity += min((punct_density - 0.1) * 0.3, 0.1)  # Cap at 0.1
@@ -133,7 +148,7 @@ class TextProcessor:
         sentences = []
         
         # Split by .?!
-        for s in re.split(r'(?<=[.!?]) +', text.strip()):
+        for s in _RE_SENT_SPLIT.split(text.strip()):
             s = s.strip()
             if s:            
                 if len(s) < max_chars:
@@ -638,7 +638,7 @@ class TTSEngine:
         target_text = self.text_processor.clean_text(target_text)
         
         # Calculate reference audio duration and text length
-        ref_text_len = self.text_processor.calculate_text_length(reference_text, self.config.pause_punctuation)
+        ref_text_len = self.text_processor.calculate_text_length(reference_text, self.config.pause_regex)
         ref_audio_len = audio.shape[-1] // self.config.hop_length + 1
         ref_audio_duration = audio.shape[-1] / self.config.sample_rate
         
@@ -646,7 +646,7 @@ class TTSEngine:
         speaking_rate = ref_text_len / ref_audio_duration if ref_audio_duration > 0 else 100
         
         # Calculate total duration including reference audio
-        target_text_len = self.text_processor.calculate_text_length(target_text, self.config.pause_punctuation)
+        target_text_len = self.text_processor.calculate_text_length(target_text, self.config.pause_regex)
         target_audio_duration = max(target_text_len / speaking_rate / self.config.speed, self.config.min_target_duration)
         total_estimated_duration = ref_audio_duration + target_audio_duration
         
@@ -691,7 +691,7 @@ class TTSEngine:
             # Post-process: verify each chunk meets duration requirements
             final_chunks = []
             for chunk in chunks:
-                chunk_text_len = self.text_processor.calculate_text_length(chunk, self.config.pause_punctuation)
+                chunk_text_len = self.text_processor.calculate_text_length(chunk, self.config.pause_regex)
                 chunk_target_duration = max(chunk_text_len / speaking_rate / self.config.speed, self.config.min_target_duration)
                 chunk_total_duration = ref_audio_duration + chunk_target_duration
                 
@@ -712,7 +712,7 @@ class TTSEngine:
         # Prepare inputs for each chunk
         inputs_list = []
         for i, chunk in enumerate(chunks):
-            chunk_text_len = self.text_processor.calculate_text_length(chunk, self.config.pause_punctuation)
+            chunk_text_len = self.text_processor.calculate_text_length(chunk, self.config.pause_regex)
             
             # Calculate target duration with minimum enforcement
             chunk_target_duration = max(chunk_text_len / speaking_rate / self.config.speed, self.config.min_target_duration)
@@ -750,6 +750,8 @@ class TTSEngine:
             input_names[2]: max_duration
         }
         
+        if self.model_session_manager.use_io_binding:
+            return self.model_session_manager.run_with_binding('preprocess', inputs)
         return session.run(output_names, inputs)
     
     def _run_transformer_steps(self, noise: np.ndarray, rope_cos_q: np.ndarray,
@@ -761,6 +763,12 @@ class TTSEngine:
         input_names = self.model_session_manager.input_names['transformer']
         output_names = self.model_session_manager.output_names['transformer']
         
+        if self.model_session_manager.use_io_binding:
+            return self._run_transformer_steps_bound(
+                noise, rope_cos_q, rope_sin_q, rope_cos_k, rope_sin_k,
+                cat_mel_text, cat_mel_text_drop, time_step
+            )
+        
         for i in tqdm(range(0, self.config.nfe_step - 1, self.config.fuse_nfe), 
                       desc="Processing", 
                       total=self.config.nfe_step // self.config.fuse_nfe - 1):
@@ -780,6 +788,38 @@ class TTSEngine:
         
         return noise, time_step
     
+    def _run_transformer_steps_bound(self, noise: np.ndarray, rope_cos_q: np.ndarray,
+                                     rope_sin_q: np.ndarray, rope_cos_k: np.ndarray,
+                                     rope_sin_k: np.ndarray, cat_mel_text: np.ndarray,
+                                     cat_mel_text_drop: np.ndarray, time_step: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Run transformer model iteratively with device-resident inputs and outputs"""
+        manager = self.model_session_manager
+        input_names = manager.input_names['transformer']
+        
+        # Loop-invariant inputs are uploaded once, noise/time_step never leave the device
+        constant_inputs = {
+            input_names[1]: manager.to_device(rope_cos_q),
+            input_names[2]: manager.to_device(rope_sin_q),
+            input_names[3]: manager.to_device(rope_cos_k),
+            input_names[4]: manager.to_device(rope_sin_k),
+            input_names[5]: manager.to_device(cat_mel_text),
+            input_names[6]: manager.to_device(cat_mel_text_drop)
+        }
+        noise_value = manager.to_device(noise)
+        time_step_value = manager.to_device(time_step)
+        
+        for i in tqdm(range(0, self.config.nfe_step - 1, self.config.fuse_nfe), 
+                      desc="Processing", 
+                      total=self.config.nfe_step // self.config.fuse_nfe - 1):
+            
+            inputs = dict(constant_inputs)
+            inputs[input_names[0]] = noise_value
+            inputs[input_names[7]] = time_step_value
+            
+            noise_value, time_step_value = manager.run_with_binding('transformer', inputs, keep_on_device=True)
+        
+        return noise_value.numpy(), time_step_value.numpy()
+    
     def _run_decode(self, noise: np.ndarray, ref_signal_len: np.ndarray) -> np.ndarray:
         """Run decode model to generate final audio"""
         session = self.model_session_manager.sessions['decode']
@@ -791,6 +831,8 @@ class TTSEngine:
             input_names[1]: ref_signal_len
         }
         
+        if self.model_session_manager.use_io_binding:
+            return self.model_session_manager.run_with_binding('decode', inputs)[0]
         return session.run(output_names, inputs)[0]
     
     def _calculate_reference_based_chunking(self, reference_text: str, target_text: str) -> Dict[str, Any]: